@@ -0,0 +1 @@
+# Lets the tests import the top-level modules (scheduling_engine, ...) when run with pytest
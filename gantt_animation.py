@@ -0,0 +1,172 @@
+"""Blitted Gantt chart animation: artists are created once and only changes are redrawn"""
+import bisect
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.patches import Rectangle
+
+
+def pid_color_map(pids):
+    """Set3 color per pid, in order of first appearance"""
+    pids = list(dict.fromkeys(pids))
+    colors = plt.cm.Set3(np.linspace(0, 1, len(pids)))
+    return {pid: colors[i] for i, pid in enumerate(pids)}
+
+
+class BlittedGantt:
+    """Animated Gantt chart for one or more lanes of (Process, start, end)
+
+    Finished slices are baked into the saved background once, so a frame only
+    restores the background and redraws the running slice(s) and time marker.
+    Context switches, (start, end, lane) intervals, are revealed the same
+    way as hatched gaps.
+    """
+    def __init__(self, figure, canvas, lanes, title, switches=()):
+        self.figure = figure
+        self.canvas = canvas
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        self.ax = ax
+
+        # Switches are slices without a process
+        self.slices = [(lane_index, process, start, end)
+                       for lane_index, lane in enumerate(lanes) for process, start, end in lane]
+        color_map = pid_color_map(s[1].pid for s in self.slices)
+        self.slices += [(lane_index, None, start, end) for start, end, lane_index in switches if end > start]
+        self.by_start = sorted(range(len(self.slices)), key=lambda k: self.slices[k][2])
+        self.by_end = sorted(range(len(self.slices)), key=lambda k: self.slices[k][3])
+        self.starts = [self.slices[k][2] for k in self.by_start]
+        self.ends = [self.slices[k][3] for k in self.by_end]
+
+        self.bars = []
+        self.labels = []
+        for lane_index, process, start, end in self.slices:
+            if process is None:
+                bar = Rectangle((start, lane_index - 0.25), 0, 0.5, facecolor='none', edgecolor='gray',
+                                hatch='////', linewidth=0, visible=False, animated=True)
+                label = None
+            else:
+                bar = Rectangle((start, lane_index - 0.25), 0, 0.5, facecolor=color_map[process.pid],
+                                edgecolor='black', linewidth=2, visible=False, animated=True)
+                label = ax.text(start, lane_index, process.pid, ha='center', va='center',
+                                fontweight='bold', fontsize=10, visible=False, animated=True)
+            ax.add_patch(bar)
+            self.bars.append(bar)
+            self.labels.append(label)
+
+        self.marker = ax.axvline(x=0, color='red', linestyle='--', linewidth=2,
+                                 label='Current Time', animated=True)
+
+        max_time = max((s[3] for s in self.slices), default=10)
+        ax.set_ylim(-0.5, len(lanes) - 0.5)
+        if len(lanes) > 1:
+            ax.set_yticks(range(len(lanes)))
+            ax.set_yticklabels([f"CPU {i}" for i in range(len(lanes))])
+        else:
+            ax.set_yticks([])
+        ax.set_xlim(0, max_time + 1)
+        ax.set_xlabel('Time', fontweight='bold', fontsize=11)
+        ax.set_title(title, fontweight='bold', fontsize=13)
+        ax.grid(axis='x', alpha=0.3)
+        ax.legend(loc='upper right')
+
+        self.background = None
+        self.draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.seek(0)
+
+    def close(self):
+        """Stop listening to redraws (call before reusing the figure)"""
+        self.canvas.mpl_disconnect(self.draw_cid)
+
+    def _on_draw(self, event):
+        # A full redraw (first frame, seek, window resize) refreshes the background
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _bake(self, k):
+        """Show a finished slice at full width as part of the background"""
+        _, process, start, end = self.slices[k]
+        bar = self.bars[k]
+        bar.set_width(end - start)
+        bar.set_visible(True)
+        bar.set_animated(False)
+        if process is None:
+            return
+        bar.set_edgecolor('black')
+        bar.set_linewidth(2)
+        bar.set_alpha(None)
+        label = self.labels[k]
+        label.set_x((start + end) / 2)
+        label.set_visible(True)
+        label.set_animated(False)
+
+    def seek(self, current_time):
+        """Jump to any time (also backwards) with one full redraw"""
+        self.current_time = current_time
+        self.next_start = bisect.bisect_left(self.starts, current_time)
+        self.next_end = bisect.bisect_right(self.ends, current_time)
+        self.active = set()
+        for k, (_, _, start, end) in enumerate(self.slices):
+            if end <= current_time:
+                self._bake(k)
+            else:
+                self.bars[k].set_animated(True)
+                self.bars[k].set_visible(False)
+                if self.labels[k] is not None:
+                    self.labels[k].set_animated(True)
+                    self.labels[k].set_visible(False)
+                if start < current_time:
+                    self.active.add(k)
+        self.canvas.draw()
+
+    def update(self, current_time):
+        if self.background is None or current_time < self.current_time:
+            self.seek(current_time)
+            return
+        self.current_time = current_time
+        self.canvas.restore_region(self.background)
+
+        # Slices that started since the last frame
+        while self.next_start < len(self.starts) and self.starts[self.next_start] < current_time:
+            self.active.add(self.by_start[self.next_start])
+            self.next_start += 1
+
+        # Slices that finished since the last frame go into the background
+        baked = False
+        while self.next_end < len(self.ends) and self.ends[self.next_end] <= current_time:
+            k = self.by_end[self.next_end]
+            self.next_end += 1
+            if k in self.active:
+                self.active.discard(k)
+            self._bake(k)
+            self.ax.draw_artist(self.bars[k])
+            if self.labels[k] is not None:
+                self.ax.draw_artist(self.labels[k])
+            baked = True
+        if baked:
+            self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def _draw_animated(self):
+        for k in self.active:
+            _, process, start, end = self.slices[k]
+            actual_end = min(end, self.current_time)
+            bar = self.bars[k]
+            bar.set_width(actual_end - start)
+            bar.set_visible(True)
+            if process is None:
+                self.ax.draw_artist(bar)
+                continue
+            # Highlight currently running process
+            bar.set_edgecolor('red')
+            bar.set_linewidth(3)
+            bar.set_alpha(0.8)
+            label = self.labels[k]
+            label.set_x((start + actual_end) / 2)
+            label.set_visible(True)
+            self.ax.draw_artist(bar)
+            self.ax.draw_artist(label)
+        self.marker.set_xdata([self.current_time, self.current_time])
+        self.ax.draw_artist(self.marker)
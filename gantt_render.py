@@ -0,0 +1,151 @@
+"""Level-of-detail Gantt rendering: one PolyCollection per pid, re-rendered on zoom/pan"""
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+from gantt_animation import pid_color_map
+
+
+class LodGantt:
+    """Static Gantt chart for one or more lanes of (Process, start, end)
+
+    Slices are drawn as one PolyCollection per pid instead of one patch per
+    slice. When a lane has more than max_detail slices in view, it is sampled
+    once per pixel column and runs of the same pid are drawn as one bar.
+    Labels and edges are only drawn on bars wide enough to show them.
+    Context switches, (start, end, lane) intervals, are drawn as hatched gaps
+    while no more than max_detail of them are in view. The view is
+    re-rendered whenever the x limits change (zoom/pan), so set the initial
+    limits before creating it.
+    """
+    def __init__(self, ax, lanes, max_detail=2000, label_px=24, max_labels=300, bar_height=0.5,
+                 switches=()):
+        self.ax = ax
+        self.max_detail = max_detail
+        self.label_px = label_px
+        self.max_labels = max_labels
+        self.bar_height = bar_height
+
+        self.pid_labels = list(dict.fromkeys(process.pid for lane in lanes for process, _, _ in lane))
+        color_map = pid_color_map(self.pid_labels)
+        self.colors = [color_map[pid] for pid in self.pid_labels]
+        code_of = {pid: i for i, pid in enumerate(self.pid_labels)}
+
+        # Per lane: starts, ends and pid codes sorted by start (slices on a lane
+        # never overlap, so ends are sorted as well)
+        self.lanes = []
+        for lane in lanes:
+            lane = sorted(lane, key=lambda r: r[1])
+            self.lanes.append((np.array([r[1] for r in lane], dtype=np.int64),
+                               np.array([r[2] for r in lane], dtype=np.int64),
+                               np.array([code_of[r[0].pid] for r in lane], dtype=np.int64)))
+
+        self.switch_lanes = []
+        for lane_index in range(len(lanes)):
+            gaps = sorted((start, end) for start, end, lane in switches if lane == lane_index and end > start)
+            self.switch_lanes.append((np.array([g[0] for g in gaps], dtype=np.int64),
+                                      np.array([g[1] for g in gaps], dtype=np.int64)))
+
+        self.artists = []
+        # Matplotlib holds bound methods weakly; the lambda keeps the chart
+        # alive (and re-rendering) as long as the axes, without callers
+        # having to keep a reference
+        self.cid = ax.callbacks.connect('xlim_changed', lambda ax: self._on_xlim_changed(ax))
+        self.render()
+
+    def _on_xlim_changed(self, ax):
+        self.render()
+        ax.figure.canvas.draw_idle()
+
+    def _binned(self, starts, ends, codes, lo, hi, columns):
+        """One sample per pixel column, runs of the same pid merged into one bar"""
+        edges = np.linspace(lo, hi, columns + 1)
+        left, right = edges[:-1], edges[1:]
+        n = len(starts)
+
+        # A column is busy if any slice overlaps it
+        first = np.searchsorted(ends, left, side='right')
+        first_clip = np.minimum(first, n - 1)
+        busy = (first < n) & (starts[first_clip] < right)
+
+        # Prefer the slice under the column center, else the first overlapping one
+        centers = (left + right) / 2
+        under = np.searchsorted(starts, centers, side='right') - 1
+        under_clip = np.maximum(under, 0)
+        covers = (under >= 0) & (ends[under_clip] > centers)
+        code = np.where(covers, codes[under_clip], codes[first_clip])
+        code = np.where(busy, code, -1)
+
+        change = np.flatnonzero(np.diff(code)) + 1
+        run_first = np.concatenate(([0], change))
+        run_last = np.concatenate((change, [columns])) - 1
+        keep = code[run_first] >= 0
+        return left[run_first[keep]], right[run_last[keep]], code[run_first[keep]]
+
+    def render(self):
+        for artist in self.artists:
+            artist.remove()
+        self.artists = []
+
+        lo, hi = self.ax.get_xlim()
+        width_px = max(int(self.ax.bbox.width), 1)
+        units_per_px = (hi - lo) / width_px if hi > lo else 1.0
+
+        lane_parts, start_parts, end_parts, code_parts = [], [], [], []
+        for lane_index, (starts, ends, codes) in enumerate(self.lanes):
+            first = np.searchsorted(ends, lo, side='right')
+            last = np.searchsorted(starts, hi, side='left')
+            if last <= first:
+                continue
+            if last - first <= self.max_detail:
+                s, e, c = starts[first:last], ends[first:last], codes[first:last]
+            else:
+                s, e, c = self._binned(starts, ends, codes, lo, hi, width_px)
+            lane_parts.append(np.full(len(s), lane_index))
+            start_parts.append(s)
+            end_parts.append(e)
+            code_parts.append(c)
+        self._render_switches(lo, hi)
+        if not lane_parts:
+            return
+
+        lane = np.concatenate(lane_parts)
+        start = np.concatenate(start_parts).astype(float)
+        end = np.concatenate(end_parts).astype(float)
+        code = np.concatenate(code_parts)
+        width = (end - start) / units_per_px
+
+        y0 = lane - self.bar_height / 2
+        y1 = lane + self.bar_height / 2
+        verts = np.stack([np.column_stack([start, y0]), np.column_stack([start, y1]),
+                          np.column_stack([end, y1]), np.column_stack([end, y0])], axis=1)
+        linewidths = np.where(width >= 4, 1.5, 0.0)
+
+        for c in np.unique(code):
+            mask = code == c
+            collection = PolyCollection(verts[mask], facecolors=[self.colors[c]], edgecolors='black',
+                                        linewidths=linewidths[mask])
+            self.ax.add_collection(collection, autolim=False)
+            self.artists.append(collection)
+
+        # Labels only where they fit, centered on the visible part of the bar
+        for k in np.flatnonzero(width >= self.label_px)[:self.max_labels]:
+            x = (max(start[k], lo) + min(end[k], hi)) / 2
+            self.artists.append(self.ax.text(x, lane[k], self.pid_labels[code[k]], ha='center',
+                                             va='center', fontweight='bold', fontsize=9, clip_on=True))
+
+    def _render_switches(self, lo, hi):
+        verts = []
+        for lane_index, (starts, ends) in enumerate(self.switch_lanes):
+            first = np.searchsorted(ends, lo, side='right')
+            last = np.searchsorted(starts, hi, side='left')
+            if last <= first or last - first > self.max_detail:
+                continue
+            y0 = lane_index - self.bar_height / 2
+            y1 = lane_index + self.bar_height / 2
+            verts.extend([(s, y0), (s, y1), (e, y1), (e, y0)]
+                         for s, e in zip(starts[first:last].tolist(), ends[first:last].tolist()))
+        if verts:
+            collection = PolyCollection(verts, facecolors='none', edgecolors='gray', hatch='////',
+                                        linewidths=0)
+            self.ax.add_collection(collection, autolim=False)
+            self.artists.append(collection)
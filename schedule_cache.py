@@ -0,0 +1,102 @@
+"""LRU cache of computed schedules keyed by (algorithm, options, workload) fingerprint"""
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+# Bump when engine output or the shape of cached values changes so stale
+# entries on disk are not reused. 2: GUI values became (lanes, results,
+# index, columns, metrics) tuples; 3: context-switch intervals added to
+# them; 4: Process gained the bursts slot.
+CACHE_VERSION = 4
+
+
+def workload_fingerprint(processes):
+    """Hash of the process list in order (order breaks ties in the schedulers)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for p in processes:
+        bursts = f"\x1f{p.bursts}" if p.bursts else ""
+        digest.update(f"{p.pid}\x1f{p.arrival_time}\x1f{p.burst_time}\x1f{p.priority}{bursts}\x1e".encode())
+    return digest.hexdigest()
+
+
+def schedule_key(algorithm, processes, **options):
+    """Cache key for running `algorithm` with `options` (quantum, cpus, ...) on `processes`"""
+    settings = ",".join(f"{name}={options[name]!r}" for name in sorted(options))
+    digest = hashlib.blake2b(f"v{CACHE_VERSION}|{algorithm}|{settings}|".encode(), digest_size=16)
+    digest.update(workload_fingerprint(processes).encode())
+    return digest.hexdigest()
+
+
+class ScheduleCache:
+    """In-memory LRU of schedules, optionally backed by one pickle file per key
+
+    Cached values are shared, not copied: callers must treat them as read-only.
+    Safe to use from worker threads (values are computed outside the lock).
+    """
+    def __init__(self, maxsize=16, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+        if self.directory:
+            try:
+                with open(self._path(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory:
+            path = self._path(key)
+            with open(path + ".tmp", "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+
+    def _remember(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop all entries (and their files when persisted)"""
+        with self.lock:
+            self.entries.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pickle"):
+                    os.remove(os.path.join(self.directory, name))
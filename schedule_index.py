@@ -0,0 +1,105 @@
+"""Time index over a schedule: process status at any time in O(log n)"""
+import bisect
+
+
+class ScheduleStatus:
+    def __init__(self, time, running, waiting, completed, waiting_count, completed_count):
+        self.time = time
+        self.running = running  # [(lane, Process, start, end), ...]
+        self.waiting = waiting  # most recently arrived first, at most `limit`
+        self.completed = completed  # most recently completed first, at most `limit`
+        self.waiting_count = waiting_count
+        self.completed_count = completed_count
+
+
+class ScheduleIndex:
+    """Sorted start/end arrays per lane plus per-process first start / last end
+
+    Built once per schedule. status_at(t) answers which process runs on each
+    lane by bisecting that lane's slice starts, and how many processes have
+    arrived/completed by bisecting the sorted arrival and completion times.
+    """
+    def __init__(self, lanes):
+        self.lanes = [sorted(lane, key=lambda r: r[1]) for lane in lanes]
+        self.lane_starts = [[r[1] for r in lane] for lane in self.lanes]
+
+        # Per process (by identity): its Process object and last slice end
+        last_end = {}
+        processes = {}
+        for lane in self.lanes:
+            for process, start, end in lane:
+                key = id(process)
+                processes[key] = process
+                if end > last_end.get(key, -1):
+                    last_end[key] = end
+
+        by_arrival = sorted(processes.values(), key=lambda p: p.arrival_time)
+        self.arrivals = [p.arrival_time for p in by_arrival]
+        self.by_arrival = by_arrival
+        self.last_end_of = [last_end[id(p)] for p in by_arrival]
+
+        by_end = sorted(processes.values(), key=lambda p: last_end[id(p)])
+        self.ends = [last_end[id(p)] for p in by_end]
+        self.by_end = by_end
+
+        self.end_time = max(self.ends, default=0)
+
+        # Times at which the picture changes: arrivals and slice boundaries
+        events = set(self.arrivals)
+        for lane in self.lanes:
+            for _, start, end in lane:
+                events.add(start)
+                events.add(end)
+        self.event_times = sorted(events)
+
+    def running_at(self, time):
+        running = []
+        for lane_index, lane in enumerate(self.lanes):
+            i = bisect.bisect_right(self.lane_starts[lane_index], time) - 1
+            if i >= 0 and lane[i][2] > time:
+                running.append((lane_index,) + lane[i])
+        return running
+
+    def completed_count(self, time):
+        return bisect.bisect_right(self.ends, time)
+
+    def arrived_count(self, time):
+        return bisect.bisect_right(self.arrivals, time)
+
+    def next_frame_time(self, time, frames_per_gap=0):
+        """Next animation time after `time` that skips over stretches without events
+
+        The next event is reached in at most frames_per_gap + 1 frames, so the
+        number of frames depends on the number of events, not on burst lengths.
+        Past the last event the clock advances one unit at a time.
+        """
+        i = bisect.bisect_right(self.event_times, time)
+        if i == len(self.event_times):
+            return time + 1
+        target = self.event_times[i]
+        previous = self.event_times[i - 1] if i else 0
+        step = -(-(target - previous) // (frames_per_gap + 1))
+        return min(target, time + max(step, 1))
+
+    def status_at(self, time, limit=20):
+        running = self.running_at(time)
+        completed_count = self.completed_count(time)
+        arrived = self.arrived_count(time)
+        waiting_count = arrived - completed_count - len(running)
+
+        completed = self.by_end[max(0, completed_count - limit):completed_count][::-1]
+
+        # Walk back from the latest arrival, where unfinished processes are found
+        # first; the walk is bounded, so a long-starved process may be left out of
+        # the list (the count stays exact)
+        running_ids = {id(r[1]) for r in running}
+        waiting = []
+        i = arrived - 1
+        stop = max(-1, arrived - 1 - limit * 64)
+        while i > stop and len(waiting) < min(limit, waiting_count):
+            p = self.by_arrival[i]
+            if self.last_end_of[i] > time and id(p) not in running_ids:
+                waiting.append(p)
+            i -= 1
+
+        return ScheduleStatus(time, running, waiting, completed, waiting_count, completed_count)
@@ -0,0 +1,184 @@
+"""Columnar (NumPy) schedule representation and vectorized metrics"""
+import csv
+from array import array
+
+import numpy as np
+
+# Per-process columns written by export_metrics()
+METRIC_COLUMNS = ("pid", "arrival", "burst", "completion", "turnaround", "waiting", "response")
+
+
+class ScheduleColumns:
+    """Schedule as arrays: one entry per process plus one entry per slice
+
+    pids[i], arrival[i], burst[i] describe process i (io[i] is its total
+    I/O time, zero unless I/O was simulated); slice_pid[k] is the process
+    index of slice k, which runs from slice_start[k] to slice_end[k].
+    """
+    def __init__(self, pids, arrival, burst, slice_pid, slice_start, slice_end, io=None):
+        self.pids = pids
+        self.arrival = np.asarray(arrival, dtype=np.int64)
+        self.burst = np.asarray(burst, dtype=np.int64)
+        self.io = np.zeros(len(pids), dtype=np.int64) if io is None else np.asarray(io, dtype=np.int64)
+        self.slice_pid = np.asarray(slice_pid, dtype=np.int64)
+        self.slice_start = np.asarray(slice_start, dtype=np.int64)
+        self.slice_end = np.asarray(slice_end, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.pids)
+
+
+def to_columns(results, io=False):
+    """Build ScheduleColumns from engine results [(Process, start, end), ...]
+
+    Slices of one process share the same Process object, so processes are
+    told apart by identity (two processes may carry the same pid label).
+    Pass io=True for io_schedule() results so waiting time excludes the
+    I/O bursts; other algorithms run each process as one CPU burst.
+    """
+    index_of = {}
+    pids = []
+    arrival = []
+    burst = []
+    io_time = []
+    slice_pid = np.empty(len(results), dtype=np.int64)
+    slice_start = np.empty(len(results), dtype=np.int64)
+    slice_end = np.empty(len(results), dtype=np.int64)
+
+    for k, (process, start, end) in enumerate(results):
+        index = index_of.get(id(process))
+        if index is None:
+            index = index_of[id(process)] = len(pids)
+            pids.append(process.pid)
+            arrival.append(process.arrival_time)
+            burst.append(process.burst_time)
+            if io:
+                io_time.append(process.io_time)
+        slice_pid[k] = index
+        slice_start[k] = start
+        slice_end[k] = end
+
+    return ScheduleColumns(pids, arrival, burst, slice_pid, slice_start, slice_end, io_time if io else None)
+
+
+def workload_columns(workload, slices):
+    """Build ScheduleColumns from a Workload and the ScheduleSlices run on it"""
+    return ScheduleColumns(workload.pids, workload.arrival, workload.burst,
+                           slices.index, slices.start, slices.end)
+
+
+def compute_metrics(columns):
+    """Per-process CT, TAT, WT and RT arrays (indexed like columns.pids)"""
+    n = len(columns)
+    first_start = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    completion = np.zeros(n, dtype=np.int64)
+    np.minimum.at(first_start, columns.slice_pid, columns.slice_start)
+    np.maximum.at(completion, columns.slice_pid, columns.slice_end)
+
+    turnaround = completion - columns.arrival
+    return {
+        "completion": completion,
+        "turnaround": turnaround,
+        "waiting": turnaround - columns.burst - columns.io,
+        "response": first_start - columns.arrival,
+    }
+
+
+def summarize(columns, metrics, cpus=1, switches=None):
+    """Averages, waiting time percentiles, throughput and CPU utilization
+
+    With the (start, end, cpu) intervals of a ContextSwitches run, the span
+    includes switching, cpu_utilization counts useful work only and
+    cpu_busy counts switching as busy time.
+    """
+    if not len(columns):
+        return {}
+    first = int(columns.slice_start.min())
+    overhead = 0
+    if switches:
+        first = min(first, min(start for start, _, _ in switches))
+        overhead = sum(end - start for start, end, _ in switches)
+    makespan = int(columns.slice_end.max()) - first
+    busy = int((columns.slice_end - columns.slice_start).sum())
+    p50, p95, p99 = np.percentile(metrics["waiting"], [50, 95, 99])
+    return {
+        "processes": len(columns),
+        "slices": len(columns.slice_pid),
+        "makespan": makespan,
+        "avg_turnaround": float(metrics["turnaround"].mean()),
+        "avg_waiting": float(metrics["waiting"].mean()),
+        "avg_response": float(metrics["response"].mean()),
+        "p50_waiting": float(p50),
+        "p95_waiting": float(p95),
+        "p99_waiting": float(p99),
+        "max_waiting": int(metrics["waiting"].max()),
+        "throughput": len(columns) / makespan if makespan else 0.0,
+        "cpu_utilization": busy / (makespan * cpus) if makespan else 0.0,
+        "cpu_busy": (busy + overhead) / (makespan * cpus) if makespan else 0.0,
+        "context_switches": len(switches) if switches else 0,
+        "switch_overhead": overhead,
+    }
+
+
+def summarize_stream(results):
+    """summarize() for a one-CPU schedule consumed lazily, e.g. from fcfs_stream()
+
+    A process's metrics are read when its last slice (ending at its
+    completion time) goes by; only its waiting time is kept, for the
+    percentiles, so memory grows by 8 bytes per process.
+    """
+    waiting = array('q')
+    turnaround = response = slices = busy = 0
+    first = last = None
+    for p, start, end in results:
+        slices += 1
+        busy += end - start
+        first = start if first is None else min(first, start)
+        last = end if last is None else max(last, end)
+        if end == p.completion_time:
+            waiting.append(p.waiting_time)
+            turnaround += p.turnaround_time
+            response += p.response_time
+    if not slices:
+        return {}
+
+    n = len(waiting)
+    makespan = last - first
+    waiting = np.frombuffer(waiting, dtype=np.int64)
+    p50, p95, p99 = np.percentile(waiting, [50, 95, 99])
+    return {
+        "processes": n,
+        "slices": slices,
+        "makespan": makespan,
+        "avg_turnaround": turnaround / n,
+        "avg_waiting": float(waiting.mean()),
+        "avg_response": response / n,
+        "p50_waiting": float(p50),
+        "p95_waiting": float(p95),
+        "p99_waiting": float(p99),
+        "max_waiting": int(waiting.max()),
+        "throughput": n / makespan if makespan else 0.0,
+        "cpu_utilization": busy / makespan if makespan else 0.0,
+        "cpu_busy": busy / makespan if makespan else 0.0,
+        "context_switches": 0,
+        "switch_overhead": 0,
+    }
+
+
+def metrics_table(columns, metrics):
+    """Per-process metrics as named columns: pid labels plus one int64 array per metric"""
+    return {"pid": columns.pids, "arrival": columns.arrival, "burst": columns.burst,
+            "completion": metrics["completion"], "turnaround": metrics["turnaround"],
+            "waiting": metrics["waiting"], "response": metrics["response"]}
+
+
+def export_metrics(columns, metrics, path):
+    """Write per-process metrics to a .csv file, or a .npz file with one array per column"""
+    table = metrics_table(columns, metrics)
+    if path.lower().endswith(".npz"):
+        np.savez_compressed(path, **{name: np.asarray(table[name]) for name in METRIC_COLUMNS})
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(METRIC_COLUMNS)
+        writer.writerows(zip(table["pid"], *(table[name].tolist() for name in METRIC_COLUMNS[1:])))
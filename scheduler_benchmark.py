@@ -0,0 +1,206 @@
+"""Benchmark: wall time, peak memory and slices/sec of every algorithm over growing workloads
+
+Usage:
+    python scheduler_benchmark.py --sizes 100 1000 10000 100000 --quanta 1 4 16 --out bench.json
+    python scheduler_benchmark.py --compare bench.json --out bench_new.json --plot scaling.png
+
+FCFS, SJF, Priority and RR run on the columnar Workload path; the other
+algorithms build Process objects and are only run up to --object-limit.
+Results are stored as JSON with the interpreter/NumPy versions and git
+revision, and --compare flags cases slower than a previous run.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from scheduling_engine import ALGORITHMS, WORKLOAD_ALGORITHMS, schedule_workload, run_algorithm
+from workload_gen import generate
+
+
+def _run(algorithm, workload, processes, quantum):
+    if processes is None:
+        return len(schedule_workload(workload, algorithm, quantum))
+    return len(run_algorithm(algorithm, processes, quantum))
+
+
+def measure(algorithm, workload, quantum=None, min_time=0.2, memory=True):
+    """Best-of wall time (repeated until min_time has elapsed) and tracemalloc peak"""
+    processes = None if algorithm in WORKLOAD_ALGORITHMS else list(workload)
+    best = math.inf
+    elapsed = 0.0
+    while elapsed < min_time or best == math.inf:
+        started = time.perf_counter()
+        slices = _run(algorithm, workload, processes, quantum)
+        seconds = time.perf_counter() - started
+        best = min(best, seconds)
+        elapsed += seconds
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            _run(algorithm, workload, processes, quantum)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {"algorithm": algorithm, "quantum": quantum, "processes": len(workload),
+            "slices": slices, "seconds": best, "peak_bytes": peak,
+            "slices_per_sec": slices / best if best > 0 else None}
+
+
+def add_growth(rows):
+    """Empirical scaling exponent: slope of log(seconds) vs log(processes) from the previous size"""
+    previous = {}
+    for row in rows:
+        case = (row["algorithm"], row["quantum"])
+        before = previous.get(case)
+        row["growth"] = None
+        if before and before["seconds"] > 0 and row["seconds"] > 0:
+            row["growth"] = (math.log(row["seconds"] / before["seconds"])
+                             / math.log(row["processes"] / before["processes"]))
+        previous[case] = row
+    return rows
+
+
+def run_benchmark(algorithms, quanta, sizes, seed=0, object_limit=100000, min_time=0.2,
+                  memory=True, progress=None):
+    rows = []
+    for size in sorted(sizes):
+        workload = generate(size, seed)
+        for algorithm in algorithms:
+            if algorithm not in WORKLOAD_ALGORITHMS and size > object_limit:
+                continue
+            for quantum in (quanta if algorithm == "RR" else [None]):
+                row = measure(algorithm, workload, quantum, min_time, memory)
+                rows.append(row)
+                if progress:
+                    progress(row)
+    rows.sort(key=lambda r: (r["algorithm"], r["quantum"] or 0, r["processes"]))
+    return add_growth(rows)
+
+
+def environment():
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                  check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {"python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "revision": revision,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def compare(rows, baseline, threshold):
+    """Rows at least `threshold` times slower than the same case in baseline"""
+    before = {(r["algorithm"], r["quantum"], r["processes"]): r for r in baseline}
+    regressions = []
+    for row in rows:
+        old = before.get((row["algorithm"], row["quantum"], row["processes"]))
+        if old and old["seconds"] > 0 and row["seconds"] / old["seconds"] >= threshold:
+            regressions.append((row, row["seconds"] / old["seconds"]))
+    return regressions
+
+
+def format_row(row):
+    quantum = row['quantum'] if row['quantum'] is not None else '-'
+    peak = f"{row['peak_bytes'] / 2**20:.1f}" if row['peak_bytes'] is not None else '-'
+    growth = f"{row['growth']:.2f}" if row['growth'] is not None else '-'
+    return (f"{row['algorithm']:<10} {quantum:>4} {row['processes']:>10} {row['slices']:>11} "
+            f"{row['seconds']:>9.4f} {peak:>9} {row['slices_per_sec'] or 0:>12.0f} {growth:>6}")
+
+
+def format_table(rows):
+    lines = [f"{'Algorithm':<10} {'Q':>4} {'Processes':>10} {'Slices':>11} {'Seconds':>9} "
+             f"{'Peak MiB':>9} {'Slices/s':>12} {'Growth':>6}"]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)
+
+
+def save_plot(rows, path):
+    """Log-log seconds vs processes, one line per (algorithm, quantum)"""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(8, 5), dpi=100)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    cases = {}
+    for row in rows:
+        label = row["algorithm"] if row["quantum"] is None else f"{row['algorithm']} q={row['quantum']}"
+        cases.setdefault(label, []).append(row)
+    for label, case_rows in cases.items():
+        ax.plot([r["processes"] for r in case_rows], [r["seconds"] for r in case_rows],
+                marker='o', label=label)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('Processes', fontweight='bold')
+    ax.set_ylabel('Seconds', fontweight='bold')
+    ax.set_title('Scheduler scaling', fontweight='bold')
+    ax.grid(alpha=0.3, which='both')
+    ax.legend(fontsize=8)
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark CPU scheduling algorithms over workload sizes")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument("--quanta", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10 ** k for k in range(2, 8)])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--object-limit", type=int, default=100000,
+                        help="largest size for algorithms that need Process objects")
+    parser.add_argument("--min-time", type=float, default=0.2, help="repeat each case for at least this long")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--out", help="write results to this JSON file")
+    parser.add_argument("--compare", help="previous JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported as a regression")
+    parser.add_argument("--plot", help="write a log-log scaling plot to this PNG")
+    args = parser.parse_args(argv)
+
+    if any(q <= 0 for q in args.quanta):
+        parser.error("quanta must be positive")
+    if any(size <= 0 for size in args.sizes):
+        parser.error("sizes must be positive")
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare) as f:
+                baseline = json.load(f)["results"]
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot read {args.compare}: {e}")
+
+    print(format_table([]))
+    rows = run_benchmark(args.algorithms, args.quanta, args.sizes, args.seed, args.object_limit,
+                         args.min_time, not args.no_memory,
+                         progress=lambda row: print(format_row(dict(row, growth=None)), flush=True))
+    print()
+    print(format_table(rows))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"environment": environment(), "results": rows}, f, indent=2)
+    if args.plot:
+        save_plot(rows, args.plot)
+    if baseline is not None:
+        regressions = compare(rows, baseline, args.threshold)
+        for row, ratio in regressions:
+            quantum = f" q={row['quantum']}" if row['quantum'] is not None else ""
+            print(f"REGRESSION {row['algorithm']}{quantum} n={row['processes']}: {ratio:.2f}x slower")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Headless scheduler: run algorithms on a trace, print metrics, optionally save JSON/CSV and PNG
+
+Usage:
+    python cpu_scheduler_gui.py --headless --algo RR --quantum 4 --input trace.csv --out metrics.json
+    python scheduler_cli.py --algo FCFS SJF RR --input trace.jsonl --png gantt.png
+
+tkinter is never imported, and matplotlib (Agg backend) only when --png is given.
+FCFS, SJF, Priority and RR on one CPU read the trace into a columnar Workload;
+the other algorithms, --cpus and --io-devices need a Process per job.
+--stream runs FCFS/RR straight off an arrival-sorted trace without loading it.
+"""
+import argparse
+import csv
+import json
+import os
+import time
+
+from scheduling_engine import (ALGORITHMS, IO_ALGORITHMS, QUEUE_MODES, SMP_ALGORITHMS, SWITCH_DISTRIBUTIONS,
+                               WORKLOAD_ALGORITHMS, ContextSwitches, run_algorithm, smp, merge_lanes,
+                               io_schedule, io_utilization, schedule_workload, workload_results,
+                               fcfs_stream, round_robin_stream)
+from schedule_metrics import to_columns, workload_columns, compute_metrics, summarize, summarize_stream
+from workload_io import iter_trace, load_workload
+
+COLUMNS = ("algorithm", "quantum", "cpus", "processes", "slices", "makespan", "avg_turnaround",
+           "avg_waiting", "avg_response", "p50_waiting", "p95_waiting", "p99_waiting", "max_waiting",
+           "throughput", "cpu_utilization", "cpu_busy", "context_switches", "switch_overhead",
+           "io_utilization", "io_overlap", "seconds")
+
+
+def run(algorithm, processes, quantum=None, cpus=1, queue_mode="global", switches=None, io_devices=0,
+        **options):
+    """Schedule processes and return (lanes, summary); one lane per CPU
+
+    switches is an optional ContextSwitches; its intervals stay on it. With
+    io_devices, I/O bursts are simulated on one CPU and each device gets a
+    lane after the CPU's.
+    """
+    started = time.perf_counter()
+    io_stats = None
+    if io_devices:
+        results, io_results = io_schedule(processes, algorithm, quantum, io_devices, switches,
+                                          options.get("aging"))
+        lanes = [results] + [[(p, start, end) for p, start, end, device in io_results if device == k]
+                             for k in range(io_devices)]
+        io_stats = io_utilization(results, io_results, io_devices,
+                                  switches.intervals if switches is not None else None)
+    elif cpus > 1:
+        lanes = smp(processes, cpus, algorithm, quantum, queue_mode, switches=switches,
+                    aging=options.get("aging"))
+        results = merge_lanes(lanes)
+    else:
+        results = run_algorithm(algorithm, processes, quantum, switches=switches, **options)
+        lanes = [results]
+    columns = to_columns(results, io=bool(io_devices))
+    summary = summarize(columns, compute_metrics(columns), cpus,
+                        switches.intervals if switches is not None else None)
+    if io_stats is not None:
+        # A schedule starts and ends with CPU or switch time, so summarize()'s
+        # makespan and throughput already hold; io_stats shares its span
+        summary.update(io_utilization=io_stats["device_utilization"], io_overlap=io_stats["overlap"])
+    summary["seconds"] = time.perf_counter() - started
+    summary.update(algorithm=algorithm, quantum=quantum, cpus=cpus)
+    return lanes, summary
+
+
+def run_workload(algorithm, workload, quantum=None, switches=None, gantt=False, **options):
+    """FCFS, SJF, Priority or RR on one CPU over a columnar Workload; returns (lanes, summary)
+
+    No Process objects are created unless gantt is set, in which case
+    lanes holds the materialized results for save_gantt_png(); otherwise
+    it is None.
+    """
+    started = time.perf_counter()
+    slices = schedule_workload(workload, algorithm, quantum, switches=switches, **options)
+    columns = workload_columns(workload, slices)
+    summary = summarize(columns, compute_metrics(columns), 1,
+                        switches.intervals if switches is not None else None)
+    summary["seconds"] = time.perf_counter() - started
+    summary.update(algorithm=algorithm, quantum=quantum, cpus=1)
+    return ([workload_results(workload, slices)] if gantt else None), summary
+
+
+def run_stream(algorithm, path, quantum=None, coalesce=False):
+    """FCFS or RR over an arrival-sorted trace read lazily; returns the summary
+
+    Only the processes in the ready queue are held in memory (plus one
+    waiting time per process for the percentiles).
+    """
+    started = time.perf_counter()
+    processes = iter_trace(path)
+    if algorithm == "FCFS":
+        results = fcfs_stream(processes)
+    else:
+        results = round_robin_stream(processes, quantum, coalesce)
+    summary = summarize_stream(results)
+    if summary:
+        summary["seconds"] = time.perf_counter() - started
+        summary.update(algorithm=algorithm, quantum=quantum, cpus=1)
+    return summary
+
+
+def read_trace(parser, load, path):
+    """load(path), reporting unreadable or empty traces as usage errors"""
+    try:
+        trace = load(path)
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot read {path}: {e}")
+    if not len(trace):
+        parser.error(f"{path} has no processes")
+    return trace
+
+
+def save_gantt_png(lanes, title, path, switches=(), lane_labels=None):
+    """Render the Gantt chart off-screen with the Agg backend"""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from gantt_render import LodGantt
+
+    figure = Figure(figsize=(12, 1.6 + 0.5 * len(lanes)), dpi=100)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    ax.set_ylim(-0.5, len(lanes) - 0.5)
+    if len(lanes) > 1:
+        ax.set_yticks(range(len(lanes)))
+        ax.set_yticklabels(lane_labels or [f"CPU {i}" for i in range(len(lanes))])
+    else:
+        ax.set_yticks([])
+    ax.set_xlim(0, max((end for lane in lanes for _, _, end in lane), default=0) + 1)
+    LodGantt(ax, lanes, switches=switches)
+    ax.set_xlabel('Time', fontweight='bold', fontsize=10)
+    ax.set_title(title, fontweight='bold', fontsize=12)
+    ax.grid(axis='x', alpha=0.3)
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def png_path(path, algorithm, count):
+    """gantt.png -> gantt_RR.png when several algorithms are run"""
+    if count == 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{algorithm}{ext or '.png'}"
+
+
+def format_summary(rows):
+    lines = [f"{'Algorithm':<11} {'Q':>4} {'CPUs':>4} {'Avg TAT':>10} {'Avg WT':>10} {'Avg RT':>10} "
+             f"{'p95 WT':>10} {'Util':>6} {'Switches':>9} {'Sec':>7}"]
+    for row in rows:
+        quantum = row['quantum'] if row['quantum'] is not None else '-'
+        lines.append(f"{row['algorithm']:<11} {quantum:>4} {row['cpus']:>4} "
+                     f"{row['avg_turnaround']:>10.2f} {row['avg_waiting']:>10.2f} "
+                     f"{row['avg_response']:>10.2f} {row['p95_waiting']:>10.2f} "
+                     f"{row['cpu_utilization'] * 100:>5.1f}% {row['context_switches']:>9} "
+                     f"{row['seconds']:>7.3f}")
+        if row.get('io_utilization') is not None:
+            devices = ", ".join(f"{u * 100:.1f}%" for u in row['io_utilization'])
+            lines.append(f"{'':<11} I/O devices: {devices}  CPU/I/O overlap: {row['io_overlap'] * 100:.1f}%")
+    return "\n".join(lines)
+
+
+def write_rows(rows, path):
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run CPU scheduling algorithms on a trace without the GUI")
+    parser.add_argument("--algo", nargs="+", default=["FCFS"], choices=list(ALGORITHMS))
+    parser.add_argument("--quantum", type=int, default=2, help="time quantum for RR")
+    parser.add_argument("--coalesce", action="store_true", help="merge back-to-back RR slices")
+    parser.add_argument("--mlfq-quanta", nargs="+", type=int, default=[2, 4, 8])
+    parser.add_argument("--boost", type=int, help="MLFQ priority boost interval")
+    parser.add_argument("--aging", type=int, help="Priority/Priority-P: gain a level per this many units waited")
+    parser.add_argument("--cpus", type=int, default=1)
+    parser.add_argument("--queue-mode", default=QUEUE_MODES[0], choices=QUEUE_MODES)
+    parser.add_argument("--switch-cost", type=int, default=0, help="context switch cost in time units")
+    parser.add_argument("--switch-distribution", default=SWITCH_DISTRIBUTIONS[0], choices=SWITCH_DISTRIBUTIONS,
+                        help="fixed cost, or drawn per switch with the cost as mean")
+    parser.add_argument("--io-devices", type=int, default=0,
+                        help="simulate the trace's I/O bursts on this many devices (one CPU)")
+    parser.add_argument("--stream", action="store_true",
+                        help="FCFS/RR: schedule an arrival-sorted trace lazily instead of loading it")
+    parser.add_argument("--input", required=True, help=".csv or .jsonl/.ndjson trace")
+    parser.add_argument("--out", help="write summary rows to a .json or .csv file")
+    parser.add_argument("--png", help="write the Gantt chart to this PNG (one per algorithm)")
+    args = parser.parse_args(argv)
+
+    if args.quantum <= 0:
+        parser.error("quantum must be positive")
+    if args.cpus < 1:
+        parser.error("cpus must be at least 1")
+    if args.switch_cost < 0:
+        parser.error("switch cost cannot be negative")
+    if args.aging is not None and args.aging <= 0:
+        parser.error("aging must be positive")
+    if args.io_devices < 0:
+        parser.error("io-devices cannot be negative")
+    if args.io_devices and (args.cpus > 1 or not set(args.algo) <= set(IO_ALGORITHMS)):
+        parser.error(f"--io-devices runs {', '.join(IO_ALGORITHMS)} on one CPU only")
+    if args.stream and (not set(args.algo) <= {"FCFS", "RR"} or args.cpus > 1 or args.io_devices
+                        or args.switch_cost or args.png):
+        parser.error("--stream runs FCFS and RR on one CPU, without switch costs, I/O or --png")
+    if args.cpus > 1 and not set(args.algo) <= SMP_ALGORITHMS:
+        parser.error(f"--cpus > 1 supports {', '.join(sorted(SMP_ALGORITHMS))} only")
+
+    # FCFS/SJF/Priority/RR on one CPU run on the trace's columns; the
+    # Process list is only read for the algorithms that need it
+    workload = processes = None
+    rows = []
+    for algorithm in args.algo:
+        options = {}
+        if algorithm == "RR":
+            options["coalesce"] = args.coalesce
+        if algorithm == "MLFQ":
+            options.update(quanta=args.mlfq_quanta, boost_interval=args.boost)
+        if algorithm in ("Priority", "Priority-P") and args.aging is not None:
+            options["aging"] = args.aging
+        quantum = args.quantum if algorithm == "RR" else None
+        switches = ContextSwitches(args.switch_cost, args.switch_distribution) if args.switch_cost else None
+        if args.stream:
+            try:
+                summary = run_stream(algorithm, args.input, quantum, args.coalesce)
+            except (OSError, ValueError) as e:
+                parser.error(f"cannot read {args.input}: {e}")
+            if not summary:
+                parser.error(f"{args.input} has no processes")
+        elif algorithm in WORKLOAD_ALGORITHMS and args.cpus == 1 and not args.io_devices:
+            if workload is None:
+                workload = read_trace(parser, load_workload, args.input)
+            lanes, summary = run_workload(algorithm, workload, quantum, switches, bool(args.png), **options)
+        else:
+            if processes is None:
+                processes = read_trace(parser, lambda path: list(iter_trace(path)), args.input)
+            lanes, summary = run(algorithm, processes, quantum, args.cpus, args.queue_mode, switches,
+                                 args.io_devices, **options)
+        rows.append({column: summary.get(column) for column in COLUMNS})
+        if args.png:
+            save_gantt_png(lanes, f"{algorithm} Scheduling - Gantt Chart",
+                           png_path(args.png, algorithm, len(args.algo)),
+                           switches.intervals if switches is not None else (),
+                           ["CPU"] + [f"IO {k}" for k in range(args.io_devices)] if args.io_devices else None)
+
+    print(format_summary(rows))
+    if args.out:
+        write_rows(rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Parameter sweep: run algorithm x quantum x workload combinations on a process pool
+
+Usage:
+    python scheduler_sweep.py --algorithms FCFS SJF Priority RR --quanta 1 2 4 8 \
+        --sizes 1000 100000 --seeds 0 1 2 --out sweep.csv
+
+Workers only import the headless engine and NumPy metrics (no tkinter/matplotlib).
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from scheduling_engine import schedule_workload
+from schedule_metrics import workload_columns, compute_metrics, summarize
+from workload_gen import generate
+
+SWEEP_ALGORITHMS = ("FCFS", "SJF", "Priority", "RR")
+
+COLUMNS = ("algorithm", "quantum", "workload", "processes", "slices", "avg_turnaround",
+           "avg_waiting", "avg_response", "p50_waiting", "p95_waiting", "p99_waiting",
+           "throughput", "cpu_utilization", "seconds")
+
+
+def build_cases(algorithms, quanta, sizes, seeds):
+    """One case per (algorithm, quantum, workload); quantum only multiplies RR"""
+    cases = []
+    for size in sizes:
+        for seed in seeds:
+            for algorithm in algorithms:
+                for quantum in (quanta if algorithm == "RR" else [None]):
+                    cases.append((algorithm, quantum, size, seed))
+    return cases
+
+
+def run_case(case):
+    algorithm, quantum, size, seed = case
+    # Regenerated from (size, seed) inside each worker instead of being pickled
+    workload = generate(size, seed)
+
+    started = time.perf_counter()
+    slices = schedule_workload(workload, algorithm, quantum, coalesce=True)
+    columns = workload_columns(workload, slices)
+    summary = summarize(columns, compute_metrics(columns))
+    summary["seconds"] = time.perf_counter() - started
+
+    summary.update(algorithm=algorithm, quantum=quantum, workload=f"n{size}-s{seed}")
+    return {column: summary.get(column) for column in COLUMNS}
+
+
+def run_sweep(cases, workers=None):
+    """Run cases on a ProcessPoolExecutor; rows come back in case order"""
+    if workers == 1:
+        return [run_case(case) for case in cases]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_case, cases))
+
+
+def format_table(rows):
+    lines = [f"{'Algorithm':<10} {'Q':>4} {'Workload':<14} {'Avg TAT':>10} {'Avg WT':>10} "
+             f"{'p95 WT':>10} {'p99 WT':>10} {'Util':>6} {'Sec':>7}"]
+    for row in rows:
+        quantum = row['quantum'] if row['quantum'] is not None else '-'
+        lines.append(f"{row['algorithm']:<10} {quantum:>4} {row['workload']:<14} "
+                     f"{row['avg_turnaround']:>10.2f} {row['avg_waiting']:>10.2f} "
+                     f"{row['p95_waiting']:>10.2f} {row['p99_waiting']:>10.2f} "
+                     f"{row['cpu_utilization'] * 100:>5.1f}% {row['seconds']:>7.3f}")
+    return "\n".join(lines)
+
+
+def write_rows(rows, path):
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=2)
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep CPU scheduling algorithms over quanta and workloads")
+    parser.add_argument("--algorithms", nargs="+", default=list(SWEEP_ALGORITHMS), choices=SWEEP_ALGORITHMS)
+    parser.add_argument("--quanta", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000])
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", help="write rows to a .csv or .json file")
+    args = parser.parse_args(argv)
+
+    if any(q <= 0 for q in args.quanta):
+        parser.error("quanta must be positive")
+    if any(size <= 0 for size in args.sizes):
+        parser.error("sizes must be positive")
+
+    rows = run_sweep(build_cases(args.algorithms, args.quanta, args.sizes, args.seeds), args.workers)
+    print(format_table(rows))
+    if args.out:
+        write_rows(rows, args.out)
+
+
+if __name__ == "__main__":
+    main()
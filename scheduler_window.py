@@ -0,0 +1,891 @@
+"""Tk window of the CPU scheduling simulator; cpu_scheduler_gui.py starts it
+
+Imports tkinter and matplotlib, so headless runs never import this module.
+"""
+import time
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+
+from scheduling_engine import (Process, ContextSwitches, run_algorithm, reschedule, smp, merge_lanes,
+                               cpu_utilization, QUANTUM_ALGORITHMS, SMP_ALGORITHMS, QUEUE_MODES,
+                               SWITCH_DISTRIBUTIONS)
+from schedule_metrics import (to_columns, compute_metrics, summarize, metrics_table, export_metrics,
+                              METRIC_COLUMNS)
+from schedule_index import ScheduleIndex
+from schedule_cache import ScheduleCache, schedule_key
+from workload_io import iter_trace
+from gantt_animation import BlittedGantt, pid_color_map
+from gantt_render import LodGantt
+from virtual_table import VirtualTable
+from workload_gen import generate as generate_workload
+
+
+class CPUSchedulerGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("CPU Scheduling Algorithm Simulator")
+        self.root.geometry("1400x900")
+        self.root.configure(bg='#f0f0f0')
+        
+        self.processes = []
+        self.results = []
+        self.lanes = []  # per-CPU results when simulating more than one CPU
+        self.schedule_index = ScheduleIndex([])
+        self.schedule_cache = ScheduleCache(maxsize=16)
+        self.last_schedule = None  # (settings key, process count, results) of the last 1-CPU run
+        self.metrics = None  # (ScheduleColumns, metrics) of the displayed results, for export
+        self.switch_intervals = None  # (start, end, cpu) context switches when a switch cost is set
+        self.aging = None  # aging interval of the displayed Priority schedule
+        self.job_id = 0  # bumped to start or cancel a background scheduling job
+        self.job_started = 0
+        self.animation_running = False
+        self.animation_paused = False
+        self.current_time = 0
+        self.animation_speed = 500  # milliseconds per time unit
+        self.blit_gantt = None  # BlittedGantt while a blitted animation is running
+        self.max_time = 0
+        
+        self.create_widgets()
+    
+    def create_widgets(self):
+        # Title
+        title_frame = tk.Frame(self.root, bg='#2c3e50', pady=10)
+        title_frame.pack(fill=tk.X)
+        tk.Label(title_frame, text="CPU SCHEDULING ALGORITHM SIMULATOR", 
+                font=('Arial', 18, 'bold'), bg='#2c3e50', fg='white').pack()
+        
+        # Create main container with scrollbar
+        container = tk.Frame(self.root, bg='#f0f0f0')
+        container.pack(fill=tk.BOTH, expand=True)
+        
+        # Create canvas and scrollbar
+        canvas = tk.Canvas(container, bg='#f0f0f0')
+        scrollbar = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg='#f0f0f0')
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Pack canvas and scrollbar
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Bind mousewheel
+        def _on_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        
+        # Main container
+        main_frame = tk.Frame(scrollable_frame, bg='#f0f0f0')
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Left panel - Input
+        left_frame = tk.LabelFrame(main_frame, text="Process Input", 
+                                   font=('Arial', 12, 'bold'), bg='#ecf0f1', padx=10, pady=10)
+        left_frame.grid(row=0, column=0, sticky='nsew', padx=5, pady=5)
+        
+        # Process ID
+        tk.Label(left_frame, text="Process ID:", bg='#ecf0f1', font=('Arial', 10)).grid(row=0, column=0, sticky='w', pady=5)
+        self.pid_entry = tk.Entry(left_frame, width=15, font=('Arial', 10))
+        self.pid_entry.grid(row=0, column=1, pady=5)
+        
+        # Arrival Time
+        tk.Label(left_frame, text="Arrival Time:", bg='#ecf0f1', font=('Arial', 10)).grid(row=1, column=0, sticky='w', pady=5)
+        self.arrival_entry = tk.Entry(left_frame, width=15, font=('Arial', 10))
+        self.arrival_entry.grid(row=1, column=1, pady=5)
+        
+        # Burst Time
+        tk.Label(left_frame, text="Burst Time:", bg='#ecf0f1', font=('Arial', 10)).grid(row=2, column=0, sticky='w', pady=5)
+        self.burst_entry = tk.Entry(left_frame, width=15, font=('Arial', 10))
+        self.burst_entry.grid(row=2, column=1, pady=5)
+        
+        # Priority
+        tk.Label(left_frame, text="Priority (lower=higher):", bg='#ecf0f1', font=('Arial', 10)).grid(row=3, column=0, sticky='w', pady=5)
+        self.priority_entry = tk.Entry(left_frame, width=15, font=('Arial', 10))
+        self.priority_entry.grid(row=3, column=1, pady=5)
+        self.priority_entry.insert(0, "0")
+        
+        # Buttons
+        button_frame = tk.Frame(left_frame, bg='#ecf0f1')
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
+        
+        tk.Button(button_frame, text="Add Process", command=self.add_process, 
+                 bg='#27ae60', fg='white', font=('Arial', 10, 'bold'), 
+                 width=12, cursor='hand2').pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Clear All", command=self.clear_all, 
+                 bg='#e74c3c', fg='white', font=('Arial', 10, 'bold'), 
+                 width=12, cursor='hand2').pack(side=tk.LEFT, padx=5)
+        
+        # Process List (virtualized: only the visible rows are widgets)
+        list_frame = tk.Frame(left_frame, bg='#ecf0f1')
+        list_frame.grid(row=5, column=0, columnspan=2, pady=10, sticky='nsew')
+        
+        self.process_table = VirtualTable(
+            list_frame,
+            [("PID", 70, lambda p: str(p.pid)), ("AT", 60, lambda p: p.arrival_time),
+             ("BT", 60, lambda p: p.burst_time), ("Priority", 60, lambda p: p.priority)],
+            lambda p: (p.pid, p.arrival_time, p.burst_time, p.priority),
+            height=10, bg='#ecf0f1')
+        self.process_table.pack(fill=tk.BOTH, expand=True)
+        self.process_table.set_rows(self.processes)
+        
+        # Bulk input: import a trace or generate N random processes
+        bulk_frame = tk.Frame(list_frame, bg='#ecf0f1')
+        bulk_frame.pack(fill=tk.X, pady=5)
+        tk.Button(bulk_frame, text="Import...", command=self.import_processes,
+                 bg='#16a085', fg='white', font=('Arial', 9, 'bold'),
+                 cursor='hand2').pack(side=tk.LEFT, padx=3)
+        tk.Button(bulk_frame, text="Random", command=self.generate_processes,
+                 bg='#16a085', fg='white', font=('Arial', 9, 'bold'),
+                 cursor='hand2').pack(side=tk.LEFT, padx=3)
+        self.random_count_spinbox = tk.Spinbox(bulk_frame, from_=1, to=1000000, width=8, font=('Arial', 9))
+        self.random_count_spinbox.delete(0, tk.END)
+        self.random_count_spinbox.insert(0, "100")
+        self.random_count_spinbox.pack(side=tk.LEFT, padx=3)
+        self.process_count_label = tk.Label(bulk_frame, text="0 processes", bg='#ecf0f1', font=('Arial', 9))
+        self.process_count_label.pack(side=tk.RIGHT, padx=3)
+        
+        # Algorithm Selection
+        algo_frame = tk.LabelFrame(left_frame, text="Select Algorithm", 
+                                   font=('Arial', 11, 'bold'), bg='#ecf0f1', pady=10)
+        algo_frame.grid(row=6, column=0, columnspan=2, sticky='ew', pady=10)
+        
+        self.algorithm_var = tk.StringVar(value="FCFS")
+        algorithms = [("FCFS", "FCFS"), ("SJF", "SJF"), ("Priority", "Priority"), ("Round Robin", "RR"),
+                      ("SRTF", "SRTF"), ("Preemptive Priority", "Priority-P"), ("MLFQ", "MLFQ")]
+        
+        for i, (text, value) in enumerate(algorithms):
+            tk.Radiobutton(algo_frame, text=text, variable=self.algorithm_var, 
+                          value=value, bg='#ecf0f1', font=('Arial', 10),
+                          command=self.toggle_quantum).grid(row=i//2, column=i%2, sticky='w', padx=10)
+        options_row = (len(algorithms) + 1) // 2
+        
+        # Quantum for Round Robin
+        self.quantum_frame = tk.Frame(algo_frame, bg='#ecf0f1')
+        self.quantum_frame.grid(row=options_row, column=0, columnspan=2, pady=5)
+        tk.Label(self.quantum_frame, text="Time Quantum:", bg='#ecf0f1', font=('Arial', 10)).pack(side=tk.LEFT)
+        self.quantum_entry = tk.Entry(self.quantum_frame, width=10, font=('Arial', 10))
+        self.quantum_entry.pack(side=tk.LEFT, padx=5)
+        self.quantum_entry.insert(0, "2")
+        self.coalesce_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.quantum_frame, text="Merge slices", variable=self.coalesce_var,
+                      bg='#ecf0f1', font=('Arial', 9)).pack(side=tk.LEFT, padx=5)
+        self.quantum_frame.grid_remove()
+        
+        # Aging for Priority: one level gained per N time units waited (blank = off)
+        self.aging_frame = tk.Frame(algo_frame, bg='#ecf0f1')
+        self.aging_frame.grid(row=options_row, column=0, columnspan=2, pady=5)
+        tk.Label(self.aging_frame, text="Aging every:", bg='#ecf0f1', font=('Arial', 10)).pack(side=tk.LEFT)
+        self.aging_entry = tk.Entry(self.aging_frame, width=10, font=('Arial', 10))
+        self.aging_entry.pack(side=tk.LEFT, padx=5)
+        tk.Label(self.aging_frame, text="time units", bg='#ecf0f1', font=('Arial', 9)).pack(side=tk.LEFT)
+        self.aging_frame.grid_remove()
+        
+        # MLFQ levels
+        self.mlfq_frame = tk.Frame(algo_frame, bg='#ecf0f1')
+        self.mlfq_frame.grid(row=options_row + 1, column=0, columnspan=2, pady=5)
+        tk.Label(self.mlfq_frame, text="Level quanta:", bg='#ecf0f1', font=('Arial', 9)).grid(row=0, column=0, sticky='w')
+        self.mlfq_quanta_entry = tk.Entry(self.mlfq_frame, width=12, font=('Arial', 9))
+        self.mlfq_quanta_entry.grid(row=0, column=1, padx=5)
+        self.mlfq_quanta_entry.insert(0, "2,4,8")
+        tk.Label(self.mlfq_frame, text="Allotments:", bg='#ecf0f1', font=('Arial', 9)).grid(row=1, column=0, sticky='w')
+        self.mlfq_allot_entry = tk.Entry(self.mlfq_frame, width=12, font=('Arial', 9))
+        self.mlfq_allot_entry.grid(row=1, column=1, padx=5)
+        tk.Label(self.mlfq_frame, text="Boost every:", bg='#ecf0f1', font=('Arial', 9)).grid(row=2, column=0, sticky='w')
+        self.mlfq_boost_entry = tk.Entry(self.mlfq_frame, width=12, font=('Arial', 9))
+        self.mlfq_boost_entry.grid(row=2, column=1, padx=5)
+        self.mlfq_frame.grid_remove()
+        
+        # CPU count and queue layout for multi-core simulation
+        smp_frame = tk.Frame(algo_frame, bg='#ecf0f1')
+        smp_frame.grid(row=options_row + 2, column=0, columnspan=2, pady=5)
+        tk.Label(smp_frame, text="CPUs:", bg='#ecf0f1', font=('Arial', 10)).pack(side=tk.LEFT)
+        self.cpus_spinbox = tk.Spinbox(smp_frame, from_=1, to=16, width=4, font=('Arial', 10))
+        self.cpus_spinbox.pack(side=tk.LEFT, padx=5)
+        self.queue_mode_var = tk.StringVar(value=QUEUE_MODES[0])
+        ttk.Combobox(smp_frame, textvariable=self.queue_mode_var, values=QUEUE_MODES,
+                     width=8, state='readonly').pack(side=tk.LEFT, padx=5)
+        
+        # Context switch cost (fixed, or drawn per switch with this mean)
+        switch_frame = tk.Frame(algo_frame, bg='#ecf0f1')
+        switch_frame.grid(row=options_row + 3, column=0, columnspan=2, pady=5)
+        tk.Label(switch_frame, text="Switch cost:", bg='#ecf0f1', font=('Arial', 10)).pack(side=tk.LEFT)
+        self.switch_cost_spinbox = tk.Spinbox(switch_frame, from_=0, to=100, width=4, font=('Arial', 10))
+        self.switch_cost_spinbox.pack(side=tk.LEFT, padx=5)
+        self.switch_distribution_var = tk.StringVar(value=SWITCH_DISTRIBUTIONS[0])
+        ttk.Combobox(switch_frame, textvariable=self.switch_distribution_var, values=SWITCH_DISTRIBUTIONS,
+                     width=10, state='readonly').pack(side=tk.LEFT, padx=5)
+        
+        # Execute Button
+        execute_frame = tk.Frame(left_frame, bg='#ecf0f1')
+        execute_frame.grid(row=7, column=0, columnspan=2, pady=15)
+        
+        self.execute_btn = tk.Button(execute_frame, text="▶ EXECUTE", command=self.execute_scheduling,
+                 bg='#3498db', fg='white', font=('Arial', 11, 'bold'),
+                 width=12, height=2, cursor='hand2')
+        self.execute_btn.grid(row=0, column=0, padx=5)
+        
+        self.animate_btn = tk.Button(execute_frame, text="🎬 ANIMATE", command=self.start_animation,
+                 bg='#9b59b6', fg='white', font=('Arial', 11, 'bold'),
+                 width=12, height=2, cursor='hand2')
+        self.animate_btn.grid(row=0, column=1, padx=5)
+        
+        # Background job progress (scheduling runs on a worker thread)
+        job_frame = tk.Frame(execute_frame, bg='#ecf0f1')
+        job_frame.grid(row=1, column=0, columnspan=2, pady=(8, 0), sticky='ew')
+        self.job_progress = ttk.Progressbar(job_frame, mode='indeterminate', length=120)
+        self.job_progress.pack(side=tk.LEFT, padx=5)
+        self.job_label = tk.Label(job_frame, text="", bg='#ecf0f1', font=('Arial', 9))
+        self.job_label.pack(side=tk.LEFT, padx=3)
+        self.cancel_btn = tk.Button(job_frame, text="✖ Cancel", command=self.cancel_job,
+                 bg='#7f8c8d', fg='white', font=('Arial', 9, 'bold'),
+                 width=8, cursor='hand2', state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Animation Controls
+        control_frame = tk.Frame(left_frame, bg='#ecf0f1')
+        control_frame.grid(row=8, column=0, columnspan=2, pady=5)
+        
+        self.pause_btn = tk.Button(control_frame, text="⏸ Pause", command=self.toggle_pause,
+                 bg='#f39c12', fg='white', font=('Arial', 9, 'bold'),
+                 width=8, cursor='hand2', state=tk.DISABLED)
+        self.pause_btn.pack(side=tk.LEFT, padx=3)
+        
+        self.stop_btn = tk.Button(control_frame, text="⏹ Stop", command=self.stop_animation,
+                 bg='#e74c3c', fg='white', font=('Arial', 9, 'bold'),
+                 width=8, cursor='hand2', state=tk.DISABLED)
+        self.stop_btn.pack(side=tk.LEFT, padx=3)
+        
+        self.blit_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(control_frame, text="Fast (blit)", variable=self.blit_var,
+                      bg='#ecf0f1', font=('Arial', 9)).pack(side=tk.LEFT, padx=3)
+        
+        # Speed Control
+        speed_frame = tk.Frame(left_frame, bg='#ecf0f1')
+        speed_frame.grid(row=9, column=0, columnspan=2, pady=5)
+        tk.Label(speed_frame, text="Speed:", bg='#ecf0f1', font=('Arial', 9)).pack(side=tk.LEFT, padx=5)
+        self.speed_scale = tk.Scale(speed_frame, from_=100, to=2000, orient=tk.HORIZONTAL,
+                                    length=150, command=self.update_speed, bg='#ecf0f1')
+        self.speed_scale.set(500)
+        self.speed_scale.pack(side=tk.LEFT)
+        tk.Label(speed_frame, text="ms", bg='#ecf0f1', font=('Arial', 9)).pack(side=tk.LEFT)
+        
+        # Event skipping: jump between arrivals/slice boundaries instead of ticking every unit
+        skip_frame = tk.Frame(left_frame, bg='#ecf0f1')
+        skip_frame.grid(row=10, column=0, columnspan=2, pady=5)
+        self.skip_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(skip_frame, text="Jump to events", variable=self.skip_var,
+                      bg='#ecf0f1', font=('Arial', 9)).pack(side=tk.LEFT, padx=3)
+        tk.Label(skip_frame, text="Frames/gap:", bg='#ecf0f1', font=('Arial', 9)).pack(side=tk.LEFT, padx=3)
+        self.frames_per_gap_spinbox = tk.Spinbox(skip_frame, from_=0, to=100, width=4, font=('Arial', 9))
+        self.frames_per_gap_spinbox.delete(0, tk.END)
+        self.frames_per_gap_spinbox.insert(0, "4")
+        self.frames_per_gap_spinbox.pack(side=tk.LEFT)
+        
+        # Right panel - Results
+        right_frame = tk.Frame(main_frame, bg='#f0f0f0')
+        right_frame.grid(row=0, column=1, sticky='nsew', padx=5, pady=5)
+        
+        # Gantt Chart
+        gantt_frame = tk.LabelFrame(right_frame, text="Gantt Chart (Animation)", 
+                                    font=('Arial', 12, 'bold'), bg='#ecf0f1', padx=5, pady=5)
+        gantt_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        self.figure = Figure(figsize=(9, 3), dpi=80)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=gantt_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Zoom/pan; the results chart re-renders its level of detail on zoom
+        toolbar = NavigationToolbar2Tk(self.canvas, gantt_frame, pack_toolbar=False)
+        toolbar.update()
+        toolbar.pack(fill=tk.X, before=self.canvas.get_tk_widget())
+        
+        # Current Time Display
+        self.time_label = tk.Label(gantt_frame, text="Current Time: 0", 
+                                   font=('Arial', 12, 'bold'), bg='#ecf0f1', fg='#e74c3c')
+        self.time_label.pack(pady=5)
+        
+        # Seek slider (active while animating)
+        self.seek_scale = tk.Scale(gantt_frame, from_=0, to=1, orient=tk.HORIZONTAL, showvalue=False,
+                                   command=self.seek_animation, bg='#ecf0f1', state=tk.DISABLED)
+        self.seek_scale.pack(fill=tk.X, padx=10)
+        
+        # Process Status Display
+        status_frame = tk.LabelFrame(right_frame, text="Process Status", 
+                                     font=('Arial', 11, 'bold'), bg='#ecf0f1', padx=5, pady=5)
+        status_frame.pack(fill=tk.BOTH, pady=5)
+        
+        self.status_text = tk.Text(status_frame, height=6, width=70, font=('Courier', 9),
+                                   bg='#fffacd', relief=tk.SUNKEN, borderwidth=2)
+        self.status_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Statistics
+        stats_frame = tk.LabelFrame(right_frame, text="Statistics", 
+                                    font=('Arial', 12, 'bold'), bg='#ecf0f1', padx=10, pady=10)
+        stats_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        # Per-process metrics (virtualized; click a heading to sort)
+        self.metric_rows = {}
+        self.stats_table = VirtualTable(
+            stats_frame,
+            [("PID", 70, lambda i: str(self.metric_rows['pid'][i]))] +
+            [(heading, 60, lambda i, name=name: self.metric_rows[name][i])
+             for heading, name in (("AT", "arrival"), ("BT", "burst"), ("CT", "completion"),
+                                   ("TAT", "turnaround"), ("WT", "waiting"), ("RT", "response"))],
+            lambda i: tuple(self.metric_rows[name][i] for name in METRIC_COLUMNS),
+            height=8, bg='#ecf0f1')
+        self.stats_table.pack(fill=tk.BOTH, expand=True)
+        
+        # Summary (averages, percentiles, throughput, utilization)
+        self.stats_text = tk.Text(stats_frame, height=9, width=70, font=('Courier', 9),
+                                 bg='white', relief=tk.SUNKEN, borderwidth=2)
+        self.stats_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        tk.Button(stats_frame, text="Export metrics...", command=self.save_metrics,
+                 bg='#34495e', fg='white', font=('Arial', 9, 'bold'),
+                 cursor='hand2').pack(anchor='e', pady=(5, 0))
+        
+        # Configure grid weights
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+        left_frame.rowconfigure(5, weight=1)
+    
+    def toggle_quantum(self):
+        if self.algorithm_var.get() == "RR":
+            self.quantum_frame.grid()
+        else:
+            self.quantum_frame.grid_remove()
+        
+        if self.algorithm_var.get() == "MLFQ":
+            self.mlfq_frame.grid()
+        else:
+            self.mlfq_frame.grid_remove()
+        
+        if self.algorithm_var.get() in ("Priority", "Priority-P"):
+            self.aging_frame.grid()
+        else:
+            self.aging_frame.grid_remove()
+    
+    def update_speed(self, val):
+        self.animation_speed = int(val)
+    
+    def toggle_pause(self):
+        self.animation_paused = not self.animation_paused
+        if self.animation_paused:
+            self.pause_btn.config(text="▶ Resume")
+        else:
+            self.pause_btn.config(text="⏸ Pause")
+    
+    def stop_animation(self):
+        self.animation_running = False
+        self.animation_paused = False
+        self.pause_btn.config(state=tk.DISABLED, text="⏸ Pause")
+        self.stop_btn.config(state=tk.DISABLED)
+        self.current_time = 0
+        self.seek_scale.config(state=tk.DISABLED)
+        self.close_blit_gantt()
+    
+    def seek_animation(self, val):
+        """Jump the running (or paused) animation to the slider position"""
+        seek_time = int(float(val))
+        # Programmatic set() calls from animate_scheduling also land here
+        if not self.animation_running or seek_time == min(self.current_time, self.max_time):
+            return
+        self.current_time = seek_time
+        self.draw_frame()
+        self.time_label.config(text=f"Current Time: {self.current_time}")
+    
+    def close_blit_gantt(self):
+        if self.blit_gantt:
+            self.blit_gantt.close()
+            self.blit_gantt = None
+    
+    def add_process(self):
+        try:
+            pid = self.pid_entry.get().strip()
+            arrival = int(self.arrival_entry.get())
+            burst = int(self.burst_entry.get())
+            priority = int(self.priority_entry.get())
+            
+            if not pid:
+                messagebox.showwarning("Warning", "Please enter Process ID!")
+                return
+            
+            if burst <= 0:
+                messagebox.showwarning("Warning", "Burst time must be positive!")
+                return
+            
+            self.add_processes([Process(pid, arrival, burst, priority)])
+            
+            # Clear entries
+            self.pid_entry.delete(0, tk.END)
+            self.arrival_entry.delete(0, tk.END)
+            self.burst_entry.delete(0, tk.END)
+            self.priority_entry.delete(0, tk.END)
+            self.priority_entry.insert(0, "0")
+            
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numbers!")
+    
+    def add_processes(self, processes):
+        """Append processes and refresh the table once (self.processes is only ever appended to)"""
+        self.processes.extend(processes)
+        self.process_table.refresh()
+        self.process_count_label.config(text=f"{len(self.processes)} processes")
+    
+    def import_processes(self):
+        path = filedialog.askopenfilename(title="Import processes",
+                                          filetypes=[("Traces", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.add_processes(list(iter_trace(path)))
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not import {path}:\n{e}")
+    
+    def generate_processes(self):
+        try:
+            count = int(self.random_count_spinbox.get())
+            if count <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number of processes!")
+            return
+        start = len(self.processes)
+        self.add_processes(list(generate_workload(count, seed=start, first_pid=start + 1)))
+    
+    def clear_all(self):
+        self.cancel_job()
+        self.stop_animation()
+        self.processes = []
+        self.process_table.set_rows(self.processes)
+        self.process_count_label.config(text="0 processes")
+        self.results = []
+        self.lanes = []
+        self.schedule_index = ScheduleIndex([])
+        self.last_schedule = None
+        self.metrics = None
+        self.switch_intervals = None
+        self.metric_rows = {}
+        self.stats_table.set_rows([])
+        self.stats_text.delete(1.0, tk.END)
+        self.status_text.delete(1.0, tk.END)
+        self.time_label.config(text="Current Time: 0")
+        self.figure.clear()
+        self.canvas.draw()
+    
+    def start_animation(self):
+        if not self.processes:
+            messagebox.showwarning("Warning", "Please add at least one process!")
+            return
+        
+        if self.animation_running:
+            messagebox.showinfo("Info", "Animation is already running!")
+            return
+        
+        # Calculate scheduling first (in the background)
+        self.run_scheduling(self.begin_animation)
+    
+    def begin_animation(self):
+        self.animation_running = True
+        self.animation_paused = False
+        self.current_time = 0
+        self.max_time = max([r[2] for r in self.results]) if self.results else 0
+        self.pause_btn.config(state=tk.NORMAL)
+        self.stop_btn.config(state=tk.NORMAL)
+        self.seek_scale.config(state=tk.NORMAL, to=max(self.max_time, 1))
+        self.seek_scale.set(0)
+        
+        self.close_blit_gantt()
+        if self.blit_var.get():
+            self.blit_gantt = BlittedGantt(self.figure, self.canvas, self.gantt_lanes(),
+                                           f'{self.algorithm_var.get()} Scheduling - Animation',
+                                           self.switch_intervals or ())
+        
+        self.animate_scheduling()
+    
+    def animate_scheduling(self):
+        if not self.animation_running:
+            return
+        
+        if self.animation_paused:
+            self.root.after(100, self.animate_scheduling)
+            return
+        
+        if self.current_time > self.max_time:
+            self.animation_running = False
+            self.pause_btn.config(state=tk.DISABLED)
+            self.stop_btn.config(state=tk.DISABLED)
+            self.seek_scale.config(state=tk.DISABLED)
+            self.close_blit_gantt()
+            self.display_results()
+            messagebox.showinfo("Complete", "Animation completed!")
+            return
+        
+        self.draw_frame()
+        
+        self.current_time = self.next_frame_time()
+        self.time_label.config(text=f"Current Time: {self.current_time}")
+        self.seek_scale.set(min(self.current_time, self.max_time))
+        
+        self.root.after(self.animation_speed, self.animate_scheduling)
+    
+    def draw_frame(self):
+        if self.blit_gantt:
+            self.blit_gantt.update(self.current_time)
+        else:
+            self.draw_animated_gantt()
+        self.update_process_status()
+    
+    def next_frame_time(self):
+        """Next tick, or the next schedule event when event skipping is on"""
+        if not self.skip_var.get():
+            return self.current_time + 1
+        try:
+            frames_per_gap = max(0, int(self.frames_per_gap_spinbox.get()))
+        except ValueError:
+            frames_per_gap = 0
+        return self.schedule_index.next_frame_time(self.current_time, frames_per_gap)
+    
+    def draw_animated_gantt(self):
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        
+        color_map = pid_color_map(r[0].pid for r in self.results)
+        
+        # Draw completed portions
+        for lane_index, lane in enumerate(self.gantt_lanes()):
+            for process, start, end in lane:
+                if start < self.current_time:
+                    actual_end = min(end, self.current_time)
+                    width = actual_end - start
+                    
+                    bar = ax.barh(lane_index, width, left=start, height=0.5, 
+                               color=color_map[process.pid], edgecolor='black', linewidth=2)
+                    
+                    # Add process label
+                    ax.text((start + actual_end) / 2, lane_index, process.pid, 
+                           ha='center', va='center', fontweight='bold', fontsize=10)
+                    
+                    # Highlight currently running process
+                    if start <= self.current_time < end:
+                        ax.barh(lane_index, width, left=start, height=0.5, 
+                               color=color_map[process.pid], edgecolor='red', 
+                               linewidth=3, alpha=0.8)
+        
+        # Context switches so far as hatched gaps
+        for start, end, lane_index in self.switch_intervals or ():
+            if start < self.current_time and end > start:
+                ax.barh(lane_index, min(end, self.current_time) - start, left=start, height=0.5,
+                       color='none', edgecolor='gray', hatch='////', linewidth=0)
+        
+        # Draw current time marker
+        ax.axvline(x=self.current_time, color='red', linestyle='--', linewidth=2, label='Current Time')
+        
+        max_time = max([r[2] for r in self.results]) if self.results else 10
+        self.setup_lane_axis(ax)
+        ax.set_xlim(0, max_time + 1)
+        ax.set_xlabel('Time', fontweight='bold', fontsize=11)
+        ax.set_title(f'{self.algorithm_var.get()} Scheduling - Animation', 
+                    fontweight='bold', fontsize=13)
+        ax.grid(axis='x', alpha=0.3)
+        ax.legend(loc='upper right')
+        
+        self.canvas.draw()
+    
+    def update_process_status(self):
+        self.status_text.delete(1.0, tk.END)
+        self.status_text.insert(tk.END, f"⏰ TIME: {self.current_time}\n")
+        self.status_text.insert(tk.END, "=" * 70 + "\n")
+        
+        status = self.schedule_index.status_at(self.current_time)
+        
+        # Currently running process (one per CPU)
+        for lane_index, process, start, end in status.running:
+            if self.lanes:
+                self.status_text.insert(tk.END, f"[CPU {lane_index}] ")
+            self.status_text.insert(tk.END, f"🔄 RUNNING: {process.pid} ")
+            self.status_text.insert(tk.END, f"[{start} → {end}] ")
+            self.status_text.insert(tk.END, f"(Progress: {self.current_time - start}/{end - start})\n")
+        
+        if not status.running:
+            self.status_text.insert(tk.END, "💤 CPU IDLE\n")
+        
+        self.status_text.insert(tk.END, "-" * 70 + "\n")
+        
+        if status.waiting_count:
+            self.status_text.insert(tk.END, f"⏳ WAITING ({status.waiting_count}): ")
+            self.status_text.insert(tk.END, self.format_pid_list(status.waiting, status.waiting_count) + "\n")
+        
+        if status.completed_count:
+            self.status_text.insert(tk.END, f"✅ COMPLETED ({status.completed_count}): ")
+            self.status_text.insert(tk.END, self.format_pid_list(status.completed, status.completed_count) + "\n")
+    
+    def format_pid_list(self, processes, total):
+        text = ", ".join([str(p.pid) for p in processes])
+        if total > len(processes):
+            text += f", ... (+{total - len(processes)} more)"
+        return text
+    
+    def execute_scheduling(self):
+        if not self.processes:
+            messagebox.showwarning("Warning", "Please add at least one process!")
+            return
+        
+        self.run_scheduling(self.display_results)
+    
+    def run_scheduling(self, on_done):
+        """Run the selected algorithm on a worker thread, then on_done() with self.results set
+
+        Options are read from the widgets here; the worker only sees plain values.
+        """
+        algorithm = self.algorithm_var.get()
+        quantum = None
+        options = {}
+        
+        if algorithm in QUANTUM_ALGORITHMS:
+            try:
+                quantum = int(self.quantum_entry.get())
+                if quantum <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid time quantum!")
+                return
+            options['coalesce'] = self.coalesce_var.get()
+        
+        if algorithm in ("Priority", "Priority-P") and self.aging_entry.get().strip():
+            try:
+                options['aging'] = int(self.aging_entry.get())
+                if options['aging'] <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "Aging interval must be a positive number of time units!")
+                return
+        
+        if algorithm == "MLFQ":
+            try:
+                options['quanta'] = [int(q) for q in self.mlfq_quanta_entry.get().split(',')]
+                allotments = self.mlfq_allot_entry.get().strip()
+                if allotments:
+                    options['allotments'] = [int(a) for a in allotments.split(',')]
+                boost = self.mlfq_boost_entry.get().strip()
+                if boost:
+                    options['boost_interval'] = int(boost)
+            except ValueError:
+                messagebox.showerror("Error", "MLFQ quanta/allotments must be comma separated numbers!")
+                return
+        
+        try:
+            cpus = int(self.cpus_spinbox.get())
+            if cpus < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number of CPUs!")
+            return
+        
+        if cpus > 1 and algorithm not in SMP_ALGORITHMS:
+            messagebox.showerror("Error", f"Multi-CPU mode supports {', '.join(sorted(SMP_ALGORITHMS))} only!")
+            return
+        
+        try:
+            switch_cost = int(self.switch_cost_spinbox.get())
+            if switch_cost < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid context switch cost!")
+            return
+        switch_distribution = self.switch_distribution_var.get() if switch_cost else None
+        
+        queue_mode = self.queue_mode_var.get() if cpus > 1 else None
+        settings = schedule_key(algorithm, [], quantum=quantum, cpus=cpus, queue_mode=queue_mode,
+                                switch_cost=switch_cost, switch_distribution=switch_distribution, **options)
+        processes = list(self.processes)
+        previous = self.last_schedule
+        
+        def compute():
+            switches = ContextSwitches(switch_cost, switch_distribution) if switch_cost else None
+            if cpus > 1:
+                lanes = smp(processes, cpus, algorithm, quantum, queue_mode, switches=switches,
+                            aging=options.get('aging'))
+                results = merge_lanes(lanes)
+            elif switches is not None:
+                lanes = []
+                results = run_algorithm(algorithm, processes, quantum, switches=switches, **options)
+            elif previous and previous[0] == settings and previous[1] < len(processes):
+                # Processes were only appended since: resimulate from the first new arrival
+                lanes = []
+                results = reschedule(algorithm, processes[:previous[1]], previous[2],
+                                     processes[previous[1]:], quantum, **options)
+            else:
+                lanes = []
+                results = run_algorithm(algorithm, processes, quantum, **options)
+            columns = to_columns(results)
+            return (lanes, results, ScheduleIndex(lanes if lanes else [results]), columns,
+                    compute_metrics(columns), switches.intervals if switches is not None else None)
+        
+        def work():
+            # EXECUTE, ANIMATE and switching back to an earlier algorithm reuse the cached run
+            key = schedule_key(algorithm, processes, quantum=quantum, cpus=cpus, queue_mode=queue_mode,
+                               switch_cost=switch_cost, switch_distribution=switch_distribution, **options)
+            return self.schedule_cache.get_or_compute(key, compute)
+        
+        def done(value):
+            self.lanes, self.results, self.schedule_index, columns, metrics, self.switch_intervals = value
+            self.aging = options.get('aging')
+            self.metrics = (columns, metrics)
+            if cpus == 1:
+                self.last_schedule = (settings, len(processes), self.results)
+            on_done()
+        
+        self.run_in_background(work, done)
+    
+    def run_in_background(self, work, on_done):
+        """Run work() on a worker thread and pass its result to on_done() in the Tk thread"""
+        self.job_id += 1
+        job = self.job_id
+        results = queue.Queue()
+        
+        def target():
+            try:
+                results.put((work(), None))
+            except Exception as e:
+                results.put((None, e))
+        
+        threading.Thread(target=target, daemon=True).start()
+        self.job_started = time.perf_counter()
+        self.set_busy(True)
+        self.root.after(50, self.poll_job, job, results, on_done)
+    
+    def poll_job(self, job, results, on_done):
+        if job != self.job_id:
+            return  # cancelled
+        try:
+            value, error = results.get_nowait()
+        except queue.Empty:
+            self.job_label.config(text=f"Scheduling... {time.perf_counter() - self.job_started:.1f}s")
+            self.root.after(50, self.poll_job, job, results, on_done)
+            return
+        
+        self.set_busy(False)
+        if error is not None:
+            self.job_label.config(text="Failed")
+            messagebox.showerror("Error", str(error))
+            return
+        self.job_label.config(text=f"Done in {time.perf_counter() - self.job_started:.1f}s")
+        on_done(value)
+    
+    def cancel_job(self):
+        # A Python thread cannot be interrupted: the job's result is dropped when it arrives
+        if self.cancel_btn['state'] == tk.DISABLED:
+            return
+        self.job_id += 1
+        self.set_busy(False)
+        self.job_label.config(text="Cancelled")
+    
+    def set_busy(self, busy):
+        self.execute_btn.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.animate_btn.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.cancel_btn.config(state=tk.NORMAL if busy else tk.DISABLED)
+        if busy:
+            self.job_progress.start(15)
+        else:
+            self.job_progress.stop()
+    
+    def gantt_lanes(self):
+        """One Gantt row per CPU (a single row for one CPU)"""
+        return self.lanes if self.lanes else [self.results]
+    
+    def setup_lane_axis(self, ax):
+        lane_count = len(self.gantt_lanes())
+        ax.set_ylim(-0.5, lane_count - 0.5)
+        if lane_count > 1:
+            ax.set_yticks(range(lane_count))
+            ax.set_yticklabels([f"CPU {i}" for i in range(lane_count)])
+        else:
+            ax.set_yticks([])
+    
+    def display_results(self):
+        # Clear previous results
+        self.close_blit_gantt()
+        self.figure.clear()
+        self.stats_text.delete(1.0, tk.END)
+        
+        # Draw Gantt Chart (one collection per pid, detail follows zoom level)
+        ax = self.figure.add_subplot(111)
+        self.setup_lane_axis(ax)
+        ax.set_xlim(0, max([r[2] for r in self.results]) + 1)
+        LodGantt(ax, self.gantt_lanes(), switches=self.switch_intervals or ())
+        
+        ax.set_xlabel('Time', fontweight='bold', fontsize=10)
+        ax.set_title(f'{self.algorithm_var.get()} Scheduling - Gantt Chart', 
+                    fontweight='bold', fontsize=12)
+        ax.grid(axis='x', alpha=0.3)
+        
+        self.canvas.draw()
+        
+        # Per-process metrics (computed by the worker) go to the virtual table,
+        # the summary to the text box
+        columns, metrics = self.metrics
+        summary = summarize(columns, metrics, max(len(self.lanes), 1), self.switch_intervals)
+        self.metric_rows = {name: (values if name == 'pid' else values.tolist())
+                            for name, values in metrics_table(columns, metrics).items()}
+        self.stats_table.set_rows(range(len(columns)))
+        
+        lines = ["=" * 85,
+                 f"Algorithm: {self.algorithm_var.get()}  ({len(columns)} processes, {len(self.results)} slices)",
+                 "=" * 85,
+                 f"Average Turnaround Time: {summary['avg_turnaround']:.2f}",
+                 f"Average Waiting Time:    {summary['avg_waiting']:.2f}",
+                 f"Average Response Time:   {summary['avg_response']:.2f}",
+                 f"Waiting Time p50/p95/p99: {summary['p50_waiting']:.1f} / "
+                 f"{summary['p95_waiting']:.1f} / {summary['p99_waiting']:.1f}",
+                 f"Max Waiting Time:        {summary['max_waiting']}",
+                 f"Throughput:              {summary['throughput']:.3f} processes/unit",
+                 f"CPU Utilization:         {summary['cpu_utilization'] * 100:.1f}%"]
+        if self.switch_intervals is not None:
+            lines.append(f"Context Switches:        {summary['context_switches']} "
+                         f"(overhead {summary['switch_overhead']} units, "
+                         f"CPU busy incl. switches {summary['cpu_busy'] * 100:.1f}%)")
+        if self.lanes:
+            for cpu, utilization in enumerate(cpu_utilization(self.lanes)):
+                lines.append(f"CPU {cpu} Utilization:       {utilization * 100:.1f}%")
+        lines.append("=" * 85)
+        
+        # Add algorithm description
+        descriptions = {
+            "FCFS": "\n✓ First Come First Served\n✓ Simple & Fair\n✗ Convoy Effect (long process blocks short ones)",
+            "SJF": "\n✓ Shortest Job First\n✓ Minimizes average waiting time\n✗ Starvation possible\n✗ Requires burst time estimation",
+            "Priority": "\n✓ Higher priority processes execute first\n✗ Starvation (can be solved with aging)",
+            "RR": "\n✓ Round Robin - Fair time sharing\n✓ Good for time-sharing systems\n✗ Context switching overhead if quantum too small",
+            "SRTF": "\n✓ Shortest Remaining Time First (preemptive SJF)\n✓ Optimal average waiting time\n✗ Long jobs can starve\n✗ Frequent preemption",
+            "Priority-P": "\n✓ Arriving higher priority process preempts the running one\n✓ Best response for urgent processes\n✗ Starvation (can be solved with aging)",
+            "MLFQ": "\n✓ Multi-Level Feedback Queue - short/interactive jobs stay on top levels\n✓ No burst time estimation needed\n✓ Priority boost prevents starvation\n✗ Many parameters to tune"
+        }
+        
+        lines.append(descriptions[self.algorithm_var.get()])
+        if self.aging:
+            lines.append(f"✓ Aging: +1 priority level per {self.aging} time units waited")
+        self.stats_text.insert(tk.END, "\n".join(lines) + "\n")
+    
+    def save_metrics(self):
+        if self.metrics is None:
+            messagebox.showwarning("Warning", "Please execute a schedule first!")
+            return
+        path = filedialog.asksaveasfilename(title="Export metrics", defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("NumPy columns", "*.npz")])
+        if not path:
+            return
+        try:
+            export_metrics(*self.metrics, path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not write {path}:\n{e}")
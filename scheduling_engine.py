@@ -0,0 +1,1165 @@
+"""Headless CPU scheduling engine used by cpu_scheduler_gui.py and batch jobs"""
+import bisect
+import heapq
+import numbers
+import random
+from array import array
+from collections import deque
+
+
+class Process:
+    """A job; bursts optionally alternates CPU and I/O burst lengths
+
+    bursts starts and ends with a CPU burst (cpu, io, cpu, ...). burst_time
+    is then the total CPU time and may be passed as None. Only io_schedule()
+    simulates the I/O bursts; the other algorithms run burst_time at once.
+    """
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'priority', 'bursts', 'remaining_time',
+                 'completion_time', 'turnaround_time', 'waiting_time', 'response_time')
+
+    def __init__(self, pid, arrival_time, burst_time, priority=0, bursts=None):
+        if bursts is not None:
+            bursts = tuple(bursts)
+            if len(bursts) % 2 == 0 or any(b <= 0 for b in bursts):
+                raise ValueError("bursts must be positive and alternate CPU, I/O, ..., CPU")
+            if burst_time is not None and burst_time != sum(bursts[0::2]):
+                raise ValueError("burst time must equal the total of the CPU bursts")
+            burst_time = sum(bursts[0::2])
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.bursts = bursts
+        self.remaining_time = burst_time
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+        self.response_time = -1
+
+    @property
+    def io_time(self):
+        """Total length of the I/O bursts"""
+        return sum(self.bursts[1::2]) if self.bursts else 0
+
+    def copy(self):
+        """Fresh copy with the input fields only (metrics reset)"""
+        return Process(self.pid, self.arrival_time, self.burst_time, self.priority, self.bursts)
+
+
+class Workload:
+    """Struct-of-arrays process list: one pid list and three int64 columns
+
+    FCFS, SJF, Priority and RR run on these columns directly through
+    schedule_workload(), without creating a Process per job.
+    """
+    def __init__(self, pids=(), arrival=(), burst=(), priority=None):
+        self.pids = list(pids)
+        self.arrival = array('q', arrival)
+        self.burst = array('q', burst)
+        self.priority = array('q', priority if priority is not None else [0] * len(self.pids))
+        if not len(self.pids) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("workload columns must have the same length")
+
+    @classmethod
+    def from_processes(cls, processes):
+        workload = cls()
+        for p in processes:
+            workload.append(p.pid, p.arrival_time, p.burst_time, p.priority)
+        return workload
+
+    def append(self, pid, arrival_time, burst_time, priority=0):
+        self.pids.append(pid)
+        self.arrival.append(arrival_time)
+        self.burst.append(burst_time)
+        self.priority.append(priority)
+
+    def __len__(self):
+        return len(self.pids)
+
+    def process(self, i):
+        return Process(self.pids[i], self.arrival[i], self.burst[i], self.priority[i])
+
+    def __iter__(self):
+        # Lets every Process-based algorithm accept a Workload as well
+        return (self.process(i) for i in range(len(self.pids)))
+
+
+SWITCH_DISTRIBUTIONS = ("fixed", "uniform", "exponential")
+
+
+class ContextSwitches:
+    """Context-switch cost model; records the overhead intervals of one run
+
+    Dispatching a process other than the one that last ran on the CPU
+    (including the first dispatch) costs time during which nothing runs:
+    `cost` units, or drawn per switch from "uniform" (0..2*cost) or
+    "exponential" (mean cost, rounded) with a seeded generator. Processes
+    arriving during a switch are queued; preemptive schedulers decide again
+    once it is over. Schedulers reset() it when they start, so after a run
+    intervals holds one (start, end, cpu) entry per switch.
+    """
+    def __init__(self, cost, distribution="fixed", seed=0):
+        if cost < 0:
+            raise ValueError("context switch cost cannot be negative")
+        if distribution not in SWITCH_DISTRIBUTIONS:
+            raise ValueError(f"Unknown switch cost distribution: {distribution}")
+        self.cost = cost
+        self.distribution = distribution
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        self.random = random.Random(self.seed)
+        self.intervals = []
+
+    def switch(self, time, cpu=0):
+        """Record a switch starting at time; returns when the new process starts"""
+        if self.distribution == "fixed":
+            cost = self.cost
+        elif self.distribution == "uniform":
+            cost = self.random.randint(0, 2 * self.cost)
+        else:
+            cost = round(self.random.expovariate(1 / self.cost)) if self.cost else 0
+        self.intervals.append((time, time + cost, cpu))
+        return time + cost
+
+    def __len__(self):
+        return len(self.intervals)
+
+    @property
+    def overhead(self):
+        """Total time spent switching"""
+        return sum(end - start for start, end, _ in self.intervals)
+
+
+class ScheduleSlices:
+    """Slices as parallel int64 arrays: process index, start and end"""
+    def __init__(self):
+        self.index = array('q')
+        self.start = array('q')
+        self.end = array('q')
+
+    def add(self, i, start, end, coalesce=False):
+        if coalesce and self.index and self.index[-1] == i and self.end[-1] == start:
+            self.end[-1] = end
+        else:
+            self.index.append(i)
+            self.start.append(start)
+            self.end.append(end)
+
+    def __len__(self):
+        return len(self.index)
+
+
+def _arrival_order(arrival):
+    # Stable, so processes arriving together keep their input order
+    return sorted(range(len(arrival)), key=arrival.__getitem__)
+
+
+def _fcfs_slices(arrival, burst, current_time=0, switches=None):
+    slices = ScheduleSlices()
+    if switches is not None:
+        switches.reset()
+
+    for i in _arrival_order(arrival):
+        if current_time < arrival[i]:
+            current_time = arrival[i]
+        if switches is not None:
+            current_time = switches.switch(current_time)
+
+        start_time = current_time
+        current_time += burst[i]
+        slices.add(i, start_time, current_time)
+
+    return slices
+
+
+def _non_preemptive_slices(arrival, burst, key, current_time=0, switches=None):
+    """Ready queue is a heap of (key, arrival order), so ties keep arrival order"""
+    order = _arrival_order(arrival)
+    slices = ScheduleSlices()
+    if switches is not None:
+        switches.reset()
+    ready = []
+    next_arrival = 0
+    n = len(order)
+
+    while next_arrival < n or ready:
+        if not ready and arrival[order[next_arrival]] > current_time:
+            current_time = arrival[order[next_arrival]]
+
+        # Move arrived processes into the ready heap
+        while next_arrival < n and arrival[order[next_arrival]] <= current_time:
+            heapq.heappush(ready, (key[order[next_arrival]], next_arrival))
+            next_arrival += 1
+
+        i = order[heapq.heappop(ready)[1]]
+        if switches is not None:
+            current_time = switches.switch(current_time)
+        start_time = current_time
+        current_time += burst[i]
+        slices.add(i, start_time, current_time)
+
+    return slices
+
+
+def _round_robin_slices(arrival, burst, quantum, coalesce=False, resume=None, switches=None):
+    """resume=(current_time, ready) starts at a decision with the queue holding
+    ready, which must be every process arrived by then"""
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+
+    order = _arrival_order(arrival)
+    remaining = array('q', burst)
+    n = len(order)
+    slices = ScheduleSlices()
+    current_time = 0
+    ready_queue = deque()
+    next_arrival = 0
+    loaded = None
+    if resume:
+        current_time, ready = resume
+        ready_queue.extend(ready)
+        next_arrival = len(ready_queue)
+    if switches is not None:
+        switches.reset()
+
+    while ready_queue or next_arrival < n:
+        if not ready_queue:
+            current_time = max(current_time, arrival[order[next_arrival]])
+            ready_queue.append(order[next_arrival])
+            next_arrival += 1
+
+        i = ready_queue.popleft()
+        if switches is not None and i != loaded:
+            current_time = switches.switch(current_time)
+            loaded = i
+        start_time = current_time
+        execution_time = min(quantum, remaining[i])
+        if coalesce and not ready_queue:
+            # Alone on the CPU: only an arrival can take it off at a quantum boundary
+            if next_arrival < n:
+                gap = arrival[order[next_arrival]] - current_time
+                execution_time = min(max(1, -(-gap // quantum)) * quantum, remaining[i])
+            else:
+                execution_time = remaining[i]
+        remaining[i] -= execution_time
+        current_time += execution_time
+        slices.add(i, start_time, current_time, coalesce)
+
+        # Add newly arrived processes
+        while next_arrival < n and arrival[order[next_arrival]] <= current_time:
+            ready_queue.append(order[next_arrival])
+            next_arrival += 1
+
+        # Re-add current process if not finished
+        if remaining[i] > 0:
+            ready_queue.append(i)
+
+    return slices
+
+
+def _materialize(processes, slices, copies=None):
+    """Turn index slices into [(Process, start, end), ...] with metrics filled in
+
+    Slices of the same process share one Process copy (fresh ones unless
+    prepared copies are passed).
+    """
+    if copies is None:
+        copies = [p.copy() for p in processes]
+    results = []
+    for i, start, end in zip(slices.index, slices.start, slices.end):
+        p = copies[i]
+        if p.response_time == -1:
+            p.response_time = start - p.arrival_time
+        p.remaining_time -= end - start
+        p.completion_time = end
+        results.append((p, start, end))
+
+    for p in copies:
+        p.turnaround_time = p.completion_time - p.arrival_time
+        p.waiting_time = p.turnaround_time - p.burst_time
+    return results
+
+
+def fcfs(processes, switches=None):
+    """First Come First Served - returns [(Process, start, end), ...]
+
+    Every algorithm takes an optional ContextSwitches to charge switch costs.
+    """
+    processes = list(processes)
+    return _materialize(processes, _fcfs_slices([p.arrival_time for p in processes],
+                                                [p.burst_time for p in processes], switches=switches))
+
+
+def sjf(processes, switches=None):
+    """Non-preemptive Shortest Job First"""
+    processes = list(processes)
+    bursts = [p.burst_time for p in processes]
+    return _materialize(processes, _non_preemptive_slices([p.arrival_time for p in processes],
+                                                          bursts, bursts, switches=switches))
+
+
+def _check_aging(aging):
+    """None, or the aging interval as a positive int
+
+    Whole time units keep the aged keys and preemption times integers.
+    """
+    if aging is None:
+        return None
+    if isinstance(aging, bool) or not isinstance(aging, numbers.Integral) or aging <= 0:
+        raise ValueError("aging interval must be a positive integer")
+    return int(aging)
+
+
+def _aged_priorities(arrival, priority, aging):
+    """Ready-queue keys for Priority; with aging, priority * aging + arrival
+
+    A process waiting since `arrival` has gained (t - arrival) / aging
+    levels at time t, so at every t the keys order processes by aged
+    priority (ties to the earlier arrival) and never need updating.
+    """
+    aging = _check_aging(aging)
+    if aging is None:
+        return priority
+    return array('q', (prio * aging + at for prio, at in zip(priority, arrival)))
+
+
+def priority(processes, aging=None, switches=None):
+    """Non-preemptive Priority (lower number = higher priority)
+
+    With aging (a positive int), the ready process with the smallest
+    priority * aging + arrival_time runs next: every time unit waited is
+    worth 1/aging of a level, so low priority jobs cannot starve.
+    """
+    processes = list(processes)
+    arrival = [p.arrival_time for p in processes]
+    return _materialize(processes, _non_preemptive_slices(arrival, [p.burst_time for p in processes],
+                                                          _aged_priorities(arrival, [p.priority for p in processes],
+                                                                           aging),
+                                                          switches=switches))
+
+
+def round_robin(processes, quantum, coalesce=False, switches=None):
+    """Round Robin with the given time quantum
+
+    With coalesce=True back-to-back slices of the same process are merged
+    into one (Process, start, end) entry, and a process alone on the CPU
+    runs straight to the next arrival instead of one quantum at a time.
+    """
+    processes = list(processes)
+    return _materialize(processes, _round_robin_slices([p.arrival_time for p in processes],
+                                                       [p.burst_time for p in processes],
+                                                       quantum, coalesce, switches=switches))
+
+
+def schedule_workload(workload, algorithm, quantum=None, coalesce=False, switches=None, aging=None):
+    """Run FCFS, SJF, Priority or RR on a Workload's columns
+
+    Returns ScheduleSlices whose process index refers to the workload rows.
+    """
+    if algorithm == "FCFS":
+        return _fcfs_slices(workload.arrival, workload.burst, switches=switches)
+    if algorithm == "SJF":
+        return _non_preemptive_slices(workload.arrival, workload.burst, workload.burst, switches=switches)
+    if algorithm == "Priority":
+        return _non_preemptive_slices(workload.arrival, workload.burst,
+                                      _aged_priorities(workload.arrival, workload.priority, aging),
+                                      switches=switches)
+    if algorithm == "RR":
+        return _round_robin_slices(workload.arrival, workload.burst, quantum, coalesce, switches=switches)
+    raise ValueError(f"{algorithm} cannot run on a Workload directly")
+
+
+# Algorithms schedule_workload() runs on Workload columns
+WORKLOAD_ALGORITHMS = ("FCFS", "SJF", "Priority", "RR")
+
+
+def workload_results(workload, slices):
+    """[(Process, start, end), ...] for slices run on a Workload; creates one Process per row"""
+    return _materialize(None, slices, list(workload))
+
+
+def _in_arrival_order(processes):
+    """Yield fresh copies from a stream that must already be sorted by arrival"""
+    last_arrival = None
+    for process in processes:
+        if last_arrival is not None and process.arrival_time < last_arrival:
+            raise ValueError(f"trace is not sorted by arrival time at process {process.pid}")
+        last_arrival = process.arrival_time
+        yield process.copy()
+
+
+def fcfs_stream(processes):
+    """FCFS over an arrival-ordered iterable, yielding (Process, start, end) lazily"""
+    current_time = 0
+    for p in _in_arrival_order(processes):
+        if current_time < p.arrival_time:
+            current_time = p.arrival_time
+
+        start_time = current_time
+        current_time += p.burst_time
+        p.remaining_time = 0
+        p.response_time = start_time - p.arrival_time
+        p.completion_time = current_time
+        p.turnaround_time = p.completion_time - p.arrival_time
+        p.waiting_time = p.turnaround_time - p.burst_time
+        yield (p, start_time, current_time)
+
+
+def round_robin_stream(processes, quantum, coalesce=False):
+    """Round Robin over an arrival-ordered iterable, yielding slices lazily
+
+    Only processes that have arrived and not finished are held in memory.
+    A process's metrics are final once its last slice has been yielded.
+    """
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+
+    arrivals = _in_arrival_order(processes)
+    upcoming = next(arrivals, None)
+    ready_queue = deque()
+    current_time = 0
+    pending = None
+
+    while ready_queue or upcoming is not None:
+        if not ready_queue:
+            current_time = max(current_time, upcoming.arrival_time)
+            ready_queue.append(upcoming)
+            upcoming = next(arrivals, None)
+
+        p = ready_queue.popleft()
+        if p.response_time == -1:
+            p.response_time = current_time - p.arrival_time
+
+        start_time = current_time
+        execution_time = min(quantum, p.remaining_time)
+        if coalesce and not ready_queue:
+            # Alone on the CPU: only an arrival can take it off at a quantum boundary
+            if upcoming is not None:
+                gap = upcoming.arrival_time - current_time
+                execution_time = min(max(1, -(-gap // quantum)) * quantum, p.remaining_time)
+            else:
+                execution_time = p.remaining_time
+        p.remaining_time -= execution_time
+        current_time += execution_time
+
+        # Hold back the last slice until we know it is not extended
+        if coalesce and pending and pending[0] is p and pending[2] == start_time:
+            pending = (p, pending[1], current_time)
+        else:
+            if pending:
+                yield pending
+            pending = (p, start_time, current_time)
+
+        # Add newly arrived processes
+        while upcoming is not None and upcoming.arrival_time <= current_time:
+            ready_queue.append(upcoming)
+            upcoming = next(arrivals, None)
+
+        if p.remaining_time > 0:
+            ready_queue.append(p)
+        else:
+            p.completion_time = current_time
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+
+    if pending:
+        yield pending
+
+
+def _remaining_key(process):
+    return process.remaining_time
+
+
+def _priority_key(process):
+    return process.priority
+
+
+def srtf(processes, switches=None):
+    """Shortest Remaining Time First (preemptive SJF)"""
+    return _preemptive(processes, key=_remaining_key, switches=switches)
+
+
+def preemptive_priority(processes, aging=None, switches=None):
+    """Preemptive Priority (lower number = higher priority), optionally with aging"""
+    aging = _check_aging(aging)
+    return _preemptive(processes, key=_priority_key, switches=switches, aging=aging)
+
+
+def _preemptive(processes, key, resume=None, switches=None, aging=None):
+    """Event-driven preemptive scheduler that only wakes at arrivals and completions
+
+    The running process keeps the CPU unless a ready process has a strictly
+    smaller key; ties between ready processes go to the earlier arrival.
+    resume=(current_time, copies) starts at a decision with prepared copies
+    (aligned with processes) that may have run already.
+
+    With aging (Preemptive Priority only), a process gains one priority level
+    per full `aging` time units spent ready, and keeps the level it had when
+    dispatched while it runs. Ready processes are keyed by
+    level * aging + time they became ready; the level at time t is
+    ceil((key - t) / aging), which keeps the heap order at every t, so no
+    key is ever updated; equal levels go to the process ready the longest.
+    The time at which the best waiting process gets a better level than the
+    running one is just another event.
+    """
+    processes = list(processes)
+    order = _arrival_order([p.arrival_time for p in processes])
+    if resume:
+        current_time, copies = resume
+        copies = [copies[i] for i in order]
+    else:
+        current_time = 0
+        copies = [processes[i].copy() for i in order]
+    n = len(copies)
+    results = []
+    ready = []
+    next_arrival = 0
+    running = None
+    loaded = None
+    run_start = 0
+    run_level = 0  # with aging: the (aged) priority level the running process was dispatched at
+    if switches is not None:
+        switches.reset()
+
+    def admit_arrivals():
+        nonlocal next_arrival
+        while next_arrival < n and copies[next_arrival].arrival_time <= current_time:
+            p = copies[next_arrival]
+            arrival_key = p.priority * aging + p.arrival_time if aging else key(p)
+            heapq.heappush(ready, (arrival_key, next_arrival))
+            next_arrival += 1
+
+    def running_key():
+        return run_level * aging + current_time if aging else key(copies[running])
+
+    def preempted():
+        if not ready:
+            return False
+        if aging:
+            return ready[0][0] <= running_key() - aging  # a waiting process is a level better
+        return ready[0][0] < key(copies[running])
+
+    while running is not None or ready or next_arrival < n:
+        if running is None:
+            if not ready:
+                current_time = max(current_time, copies[next_arrival].arrival_time)
+            admit_arrivals()
+
+            ready_key, running = heapq.heappop(ready)
+            if aging:
+                run_level = -((current_time - ready_key) // aging)
+            if switches is not None and running != loaded:
+                current_time = switches.switch(current_time)
+                loaded = running
+                admit_arrivals()
+                if preempted():
+                    # Preempted during the switch, before running at all
+                    heapq.heappush(ready, (running_key(), running))
+                    running = None
+                    continue
+            run_start = current_time
+            if copies[running].response_time == -1:
+                copies[running].response_time = current_time - copies[running].arrival_time
+
+        p = copies[running]
+        finish_time = current_time + p.remaining_time
+
+        # Run until the next arrival (or, with aging, until the best waiting
+        # process reaches a better level), then check for preemption
+        event_time = copies[next_arrival].arrival_time if next_arrival < n else finish_time
+        if aging and ready:
+            event_time = min(event_time, ready[0][0] - (run_level - 1) * aging)
+
+        if event_time < finish_time:
+            p.remaining_time -= event_time - current_time
+            current_time = event_time
+            admit_arrivals()
+
+            if preempted():
+                results.append((p, run_start, current_time))
+                heapq.heappush(ready, (running_key(), running))
+                running = None
+        else:
+            current_time = finish_time
+            p.remaining_time = 0
+            results.append((p, run_start, current_time))
+            p.completion_time = current_time
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+            running = None
+
+    return results
+
+
+def mlfq(processes, quanta=(2, 4, 8), boost_interval=None, allotments=None, switches=None):
+    """Multi-Level Feedback Queue
+
+    quanta[i] is the time slice of level i (level 0 is the highest). A process
+    is demoted once it has used allotments[i] time units at level i (default:
+    one full quantum); the last level is plain Round Robin. New arrivals enter
+    level 0 and preempt a process running at a lower level. Every
+    boost_interval time units all processes move back to level 0.
+    Back-to-back slices of the same process are merged.
+    """
+    quanta = list(quanta)
+    allotments = list(allotments) if allotments is not None else quanta
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError("MLFQ needs at least one level and positive quanta")
+    if len(allotments) != len(quanta) or any(a <= 0 for a in allotments):
+        raise ValueError("MLFQ needs one positive allotment per level")
+    if boost_interval is not None and boost_interval <= 0:
+        raise ValueError("boost interval must be positive")
+
+    copies = [p.copy() for p in sorted(processes, key=lambda x: x.arrival_time)]
+    n = len(copies)
+    last_level = len(quanta) - 1
+    queues = [deque() for _ in quanta]
+    used = [0] * n
+    queued = 0
+    results = []
+    current_time = 0
+    next_arrival = 0
+    next_boost = boost_interval
+    loaded = None
+    if switches is not None:
+        switches.reset()
+
+    def admit_arrivals():
+        nonlocal next_arrival, queued
+        while next_arrival < n and copies[next_arrival].arrival_time <= current_time:
+            queues[0].append(next_arrival)
+            next_arrival += 1
+            queued += 1
+
+    def boost():
+        nonlocal next_boost
+        for lower in queues[1:]:
+            queues[0].extend(lower)
+            lower.clear()
+        for index in queues[0]:
+            used[index] = 0
+        next_boost = (current_time // boost_interval + 1) * boost_interval
+
+    while next_arrival < n or queued:
+        if not queued:
+            current_time = max(current_time, copies[next_arrival].arrival_time)
+        if next_boost is not None and next_boost <= current_time:
+            boost()
+        admit_arrivals()
+
+        lvl = 0
+        while not queues[lvl]:
+            lvl += 1
+        index = queues[lvl].popleft()
+        queued -= 1
+        if switches is not None and index != loaded:
+            current_time = switches.switch(current_time)
+            loaded = index
+            admit_arrivals()
+            if any(queues[:lvl]) or (next_boost is not None and next_boost <= current_time):
+                # An arrival or boost during the switch takes precedence: decide again
+                queues[lvl].appendleft(index)
+                queued += 1
+                continue
+        p = copies[index]
+        if p.response_time == -1:
+            p.response_time = current_time - p.arrival_time
+
+        if lvl == last_level and not queued:
+            # Alone at the bottom level: run until an arrival can take the CPU,
+            # which is immediate for lower levels and at a quantum boundary otherwise
+            run_time = p.remaining_time
+            if lvl == 0 and next_arrival < n:
+                gap = copies[next_arrival].arrival_time - current_time
+                run_time = min(max(1, -(-gap // quanta[0])) * quanta[0], run_time)
+            slice_end = current_time + run_time
+        elif lvl == last_level:
+            slice_end = current_time + min(quanta[lvl], p.remaining_time)
+        else:
+            slice_end = current_time + min(quanta[lvl], allotments[lvl] - used[index], p.remaining_time)
+
+        # Only arrivals (into level 0) and boosts can cut a slice short
+        end_time = slice_end
+        if lvl > 0 and next_arrival < n:
+            end_time = min(end_time, copies[next_arrival].arrival_time)
+        if next_boost is not None:
+            end_time = min(end_time, next_boost)
+
+        start_time = current_time
+        p.remaining_time -= end_time - start_time
+        used[index] += end_time - start_time
+        current_time = end_time
+
+        if results and results[-1][0] is p and results[-1][2] == start_time:
+            results[-1] = (p, results[-1][1], current_time)
+        else:
+            results.append((p, start_time, current_time))
+
+        admit_arrivals()
+
+        if p.remaining_time == 0:
+            p.completion_time = current_time
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+            continue
+
+        queued += 1
+        if end_time < slice_end:
+            # Preempted: keep its place at the front of its level
+            queues[lvl].appendleft(index)
+        elif lvl < last_level and used[index] > allotments[lvl]:
+            used[index] = 0
+            queues[lvl + 1].append(index)
+        else:
+            queues[lvl].append(index)
+
+    return results
+
+
+IO_ALGORITHMS = ("FCFS", "SJF", "Priority", "RR")
+
+
+def io_schedule(processes, algorithm="FCFS", quantum=None, devices=1, switches=None, aging=None):
+    """One CPU and `devices` identical I/O devices for processes alternating CPU and I/O bursts
+
+    After each CPU burst but the last a process blocks: it queues FIFO for
+    the first free device and is ready again when its I/O burst ends.
+    FCFS (by time of becoming ready), SJF (shortest next CPU burst) and
+    Priority are non-preemptive; RR preempts after `quantum`. Events at the
+    same time are handled as arrivals, I/O completions, then the CPU slice
+    ending. With aging, Priority favours processes by time spent ready, as
+    in priority(). Returns (results, io_results): CPU slices [(Process, start, end), ...]
+    and I/O bursts [(Process, start, end, device), ...] sharing the same
+    Process copies. waiting_time is turnaround minus CPU and I/O time.
+    """
+    if algorithm not in IO_ALGORITHMS:
+        raise ValueError(f"{algorithm} does not support I/O bursts")
+    if devices < 1:
+        raise ValueError("need at least one I/O device")
+    aging = _check_aging(aging)
+    round_robin_mode = algorithm == "RR"
+    if round_robin_mode and (quantum is None or quantum <= 0):
+        raise ValueError("quantum must be positive")
+
+    copies = [p.copy() for p in sorted(processes, key=lambda x: x.arrival_time)]
+    n = len(copies)
+    bursts = [p.bursts or (p.burst_time,) for p in copies]
+    phase = [0] * n  # index of each process's current burst
+    left = [b[0] for b in bursts]  # remaining time of the current CPU burst
+    ready = deque() if round_robin_mode else []
+    blocked = deque()
+    free_devices = list(range(devices))
+    in_io = []  # heap of (I/O end, device, index)
+    results = []
+    io_results = []
+    current_time = 0
+    next_arrival = 0
+    finished = 0
+    enqueued = 0
+    running = None
+    loaded = None
+    run_start = run_end = 0
+    if switches is not None:
+        switches.reset()
+
+    def make_ready(i):
+        nonlocal enqueued
+        if round_robin_mode:
+            ready.append(i)
+            return
+        if algorithm == "FCFS":
+            key = enqueued
+        elif algorithm == "SJF":
+            key = left[i]
+        else:
+            key = copies[i].priority * aging + current_time if aging else copies[i].priority
+        heapq.heappush(ready, (key, enqueued, i))
+        enqueued += 1
+
+    while finished < n:
+        events = [run_end] if running is not None else []
+        if next_arrival < n:
+            events.append(copies[next_arrival].arrival_time)
+        if in_io:
+            events.append(in_io[0][0])
+        current_time = max(current_time, min(events))
+
+        while next_arrival < n and copies[next_arrival].arrival_time <= current_time:
+            make_ready(next_arrival)
+            next_arrival += 1
+
+        while in_io and in_io[0][0] <= current_time:
+            _, device, i = heapq.heappop(in_io)
+            heapq.heappush(free_devices, device)
+            phase[i] += 1
+            left[i] = bursts[i][phase[i]]
+            make_ready(i)
+
+        if running is not None and run_end <= current_time:
+            i = running
+            running = None
+            p = copies[i]
+            results.append((p, run_start, run_end))
+            left[i] -= run_end - run_start
+            p.remaining_time -= run_end - run_start
+            if left[i] > 0:
+                make_ready(i)
+            elif phase[i] == len(bursts[i]) - 1:
+                p.completion_time = current_time
+                p.turnaround_time = p.completion_time - p.arrival_time
+                p.waiting_time = p.turnaround_time - p.burst_time - p.io_time
+                finished += 1
+            else:
+                phase[i] += 1
+                blocked.append(i)
+
+        # Blocked processes take free devices, lowest device id first
+        while blocked and free_devices:
+            i = blocked.popleft()
+            device = heapq.heappop(free_devices)
+            io_end = current_time + bursts[i][phase[i]]
+            heapq.heappush(in_io, (io_end, device, i))
+            io_results.append((copies[i], current_time, io_end, device))
+
+        if running is None and ready:
+            i = ready.popleft() if round_robin_mode else heapq.heappop(ready)[2]
+            p = copies[i]
+            run_start = current_time
+            if switches is not None and i != loaded:
+                run_start = switches.switch(current_time)
+                loaded = i
+            if p.response_time == -1:
+                p.response_time = run_start - p.arrival_time
+            running = i
+            run_end = run_start + (min(quantum, left[i]) if round_robin_mode else left[i])
+
+    return results, io_results
+
+
+def io_utilization(results, io_results, devices=1, switches=None):
+    """CPU and per-device busy fractions, throughput and CPU/I/O overlap of an io_schedule() run
+
+    overlap is the fraction of the schedule during which the CPU and at
+    least one device are busy at the same time. With the (start, end, cpu)
+    intervals of a ContextSwitches run the span includes switching, as in
+    schedule_metrics.summarize().
+    """
+    intervals = [(start, end) for _, start, end in results] + [(start, end) for _, start, end, _ in io_results]
+    intervals += [(start, end) for start, end, _ in switches or ()]
+    if not intervals:
+        return {"makespan": 0, "throughput": 0.0, "cpu_utilization": 0.0,
+                "device_utilization": [0.0] * devices, "overlap": 0.0}
+    first = min(start for start, _ in intervals)
+    span = max(end for _, end in intervals) - first
+
+    device_busy = [0] * devices
+    for _, start, end, device in io_results:
+        device_busy[device] += end - start
+
+    # Union of device busy time, then its intersection with the CPU slices
+    io_union = []
+    for start, end in sorted((start, end) for _, start, end, _ in io_results):
+        if io_union and start <= io_union[-1][1]:
+            io_union[-1][1] = max(io_union[-1][1], end)
+        else:
+            io_union.append([start, end])
+    overlap = 0
+    k = 0
+    for start, end in sorted((start, end) for _, start, end in results):
+        while k < len(io_union) and io_union[k][1] <= start:
+            k += 1
+        j = k
+        while j < len(io_union) and io_union[j][0] < end:
+            overlap += min(end, io_union[j][1]) - max(start, io_union[j][0])
+            j += 1
+
+    return {
+        "makespan": span,
+        "throughput": len({id(p) for p, _, _ in results}) / span if span else 0.0,
+        "cpu_utilization": sum(end - start for _, start, end in results) / span if span else 0.0,
+        "device_utilization": [busy / span if span else 0.0 for busy in device_busy],
+        "overlap": overlap / span if span else 0.0,
+    }
+
+
+# Ready-queue keys for the non-preemptive policies supported on several CPUs
+SMP_KEYS = {
+    "FCFS": lambda x: 0,
+    "SJF": lambda x: x.burst_time,
+    "Priority": lambda x: x.priority,
+}
+
+SMP_ALGORITHMS = set(SMP_KEYS) | {"RR"}
+
+QUEUE_MODES = ("global", "per-cpu")
+
+
+def smp(processes, cpus, algorithm="FCFS", quantum=None, queue_mode="global", switches=None, aging=None):
+    """Simulate several identical CPUs - returns one [(Process, start, end), ...] lane per CPU
+
+    queue_mode "global" shares one ready queue between all CPUs. "per-cpu"
+    gives every CPU its own queue: arrivals go to the least loaded CPU, a
+    preempted RR process stays on its CPU, and an idle CPU with an empty
+    queue steals from the longest other queue. aging applies to Priority
+    as in priority().
+    """
+    if cpus < 1:
+        raise ValueError("need at least one CPU")
+    if algorithm not in SMP_ALGORITHMS:
+        raise ValueError(f"{algorithm} is not supported on multiple CPUs")
+    if queue_mode not in QUEUE_MODES:
+        raise ValueError(f"Unknown queue mode: {queue_mode}")
+    round_robin_mode = algorithm == "RR"
+    if round_robin_mode and (quantum is None or quantum <= 0):
+        raise ValueError("quantum must be positive")
+    key = SMP_KEYS.get(algorithm)
+    aging = _check_aging(aging)
+    if aging is not None and algorithm == "Priority":
+        key = lambda x: x.priority * aging + x.arrival_time
+
+    copies = [p.copy() for p in sorted(processes, key=lambda x: x.arrival_time)]
+    n = len(copies)
+    per_cpu = queue_mode == "per-cpu"
+    queues = [deque() if round_robin_mode else [] for _ in range(cpus if per_cpu else 1)]
+    lanes = [[] for _ in range(cpus)]
+    running = [None] * cpus
+    loaded = [None] * cpus
+    idle = list(range(cpus))
+    busy = []  # heap of (slice end, cpu)
+    current_time = 0
+    next_arrival = 0
+    finished = 0
+    if switches is not None:
+        switches.reset()
+
+    def enqueue(queue, index):
+        if round_robin_mode:
+            queue.append(index)
+        else:
+            heapq.heappush(queue, (key(copies[index]), index))
+
+    def take(cpu):
+        queue = queues[cpu if per_cpu else 0]
+        if queue:
+            return queue.popleft() if round_robin_mode else heapq.heappop(queue)[1]
+        if not per_cpu:
+            return None
+        # Work stealing from the longest queue (the tail for RR, the best job otherwise)
+        victim = max(queues, key=len)
+        if not victim:
+            return None
+        return victim.pop() if round_robin_mode else heapq.heappop(victim)[1]
+
+    while finished < n:
+        arrival_time = copies[next_arrival].arrival_time if next_arrival < n else None
+        if arrival_time is not None and (not busy or arrival_time <= busy[0][0]):
+            current_time = max(current_time, arrival_time)
+            while next_arrival < n and copies[next_arrival].arrival_time <= current_time:
+                if per_cpu:
+                    cpu = min(range(cpus), key=lambda c: len(queues[c]) + (running[c] is not None))
+                    enqueue(queues[cpu], next_arrival)
+                else:
+                    enqueue(queues[0], next_arrival)
+                next_arrival += 1
+        else:
+            current_time = busy[0][0]
+            while busy and busy[0][0] == current_time:
+                _, cpu = heapq.heappop(busy)
+                index = running[cpu]
+                running[cpu] = None
+                heapq.heappush(idle, cpu)
+                p = copies[index]
+                if p.remaining_time == 0:
+                    p.completion_time = current_time
+                    p.turnaround_time = p.completion_time - p.arrival_time
+                    p.waiting_time = p.turnaround_time - p.burst_time
+                    finished += 1
+                else:
+                    enqueue(queues[cpu if per_cpu else 0], index)
+
+        # Hand work to idle CPUs, lowest CPU id first
+        still_idle = []
+        while idle:
+            cpu = heapq.heappop(idle)
+            index = take(cpu)
+            if index is None:
+                still_idle.append(cpu)
+                continue
+
+            p = copies[index]
+            start_time = current_time
+            if switches is not None and loaded[cpu] != index:
+                start_time = switches.switch(current_time, cpu)
+                loaded[cpu] = index
+            if p.response_time == -1:
+                p.response_time = start_time - p.arrival_time
+            run_time = min(quantum, p.remaining_time) if round_robin_mode else p.remaining_time
+            p.remaining_time -= run_time
+            running[cpu] = index
+            heapq.heappush(busy, (start_time + run_time, cpu))
+
+            lane = lanes[cpu]
+            if lane and lane[-1][0] is p and lane[-1][2] == start_time:
+                lane[-1] = (p, lane[-1][1], start_time + run_time)
+            else:
+                lane.append((p, start_time, start_time + run_time))
+        idle = still_idle
+
+    return lanes
+
+
+def merge_lanes(lanes):
+    """Flatten per-CPU lanes into one start-ordered [(Process, start, end), ...] list"""
+    return sorted((entry for lane in lanes for entry in lane), key=lambda r: r[1])
+
+
+def cpu_utilization(lanes):
+    """Busy fraction of each CPU over the whole schedule"""
+    starts = [lane[0][1] for lane in lanes if lane]
+    if not starts:
+        return [0.0] * len(lanes)
+    span = max(lane[-1][2] for lane in lanes if lane) - min(starts)
+    return [sum(end - start for _, start, end in lane) / span if span else 0.0 for lane in lanes]
+
+
+ALGORITHMS = {
+    "FCFS": fcfs,
+    "SJF": sjf,
+    "Priority": priority,
+    "RR": round_robin,
+    "SRTF": srtf,
+    "Priority-P": preemptive_priority,
+    "MLFQ": mlfq,
+}
+
+# Algorithms that take a time quantum
+QUANTUM_ALGORITHMS = {"RR"}
+
+
+def run_algorithm(algorithm, processes, quantum=None, **options):
+    """Dispatch by the algorithm names used in the GUI (the keys of ALGORITHMS)
+
+    Extra keyword options (e.g. coalesce=True for RR) go to the algorithm.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if algorithm in QUANTUM_ALGORITHMS:
+        return ALGORITHMS[algorithm](processes, quantum, **options)
+    return ALGORITHMS[algorithm](processes, **options)
+
+
+# Algorithms reschedule() resumes mid-schedule; MLFQ levels and allotments
+# cannot be recovered from slices alone, so it always runs in full
+RESUMABLE_ALGORITHMS = {"FCFS", "SJF", "Priority", "RR", "SRTF", "Priority-P"}
+
+
+def _process_key(p):
+    return (p.pid, p.arrival_time, p.burst_time, p.priority)
+
+
+def _match_copies(processes, results):
+    """{id(copy): index into processes} for the Process copies in results
+
+    Copies are matched by their attributes. Identical processes are always
+    first served in list order, so matching them in order of first
+    appearance is exact. Returns None if a copy has no match.
+    """
+    candidates = {}
+    for i, p in enumerate(processes):
+        candidates.setdefault(_process_key(p), deque()).append(i)
+    index_of = {}
+    for p, _, _ in results:
+        if id(p) not in index_of:
+            matches = candidates.get(_process_key(p))
+            if not matches:
+                return None
+            index_of[id(p)] = matches.popleft()
+    return index_of
+
+
+def reschedule(algorithm, processes, previous, added, quantum=None, **options):
+    """Schedule processes + added, reusing previous (the schedule of processes alone)
+
+    previous must be the run_algorithm() result for processes with the same
+    settings. Slices decided before the earliest added arrival are reused,
+    sharing their Process objects with previous, and only the processes
+    still unfinished at that point plus the added ones are simulated again.
+    The result equals run_algorithm() on processes + added.
+    """
+    processes = list(processes)
+    added = list(added)
+    if (algorithm not in RESUMABLE_ALGORITHMS or not added or not previous
+            or options.get("switches") is not None or options.get("aging") is not None):
+        return run_algorithm(algorithm, processes + added, quantum, **options)
+
+    # Slices that started before the first added arrival were decided without it
+    # bisect's key= needs Python 3.10, so search a list of slice starts
+    starts = [start for _, start, _ in previous]
+    cut = bisect.bisect_left(starts, min(p.arrival_time for p in added))
+    non_preemptive = algorithm in ("FCFS", "SJF", "Priority")
+    if not non_preemptive:
+        # Resume at the decision that started the last of them: how long it
+        # runs may depend on the added arrival
+        cut -= 1
+    if cut <= 0:
+        return run_algorithm(algorithm, processes + added, quantum, **options)
+    resume_time = previous[cut - 1][2] if non_preemptive else previous[cut][1]
+
+    # Every process unfinished at resume_time runs again later in previous;
+    # keep them in order of first appearance there
+    remaining = {}
+    old_copies = {}
+    for p, start, end in previous[cut:]:
+        remaining[id(p)] = remaining.get(id(p), 0) + end - start
+        old_copies.setdefault(id(p), p)
+
+    # List index of each old copy (matching every slice is only needed for
+    # workloads with identical processes)
+    index = {_process_key(p): i for i, p in enumerate(processes)}
+    if len(index) == len(processes):
+        index_of = {copy_id: index.get(_process_key(p)) for copy_id, p in old_copies.items()}
+        if None in index_of.values():
+            index_of = None
+    else:
+        index_of = _match_copies(processes, previous)
+    if index_of is None:
+        return run_algorithm(algorithm, processes + added, quantum, **options)
+
+    active = sorted(old_copies.values(), key=lambda p: index_of[id(p)])
+    sub = [processes[index_of[id(p)]] for p in active] + added
+    arrival = [p.arrival_time for p in sub]
+    burst = [p.burst_time for p in sub]
+
+    # Copies start from their state at resume_time
+    copies = [p.copy() for p in sub]
+    new_copy = {}
+    for q, p in zip(copies, active):
+        q.remaining_time = remaining[id(p)]
+        if q.remaining_time < q.burst_time:
+            q.response_time = p.response_time
+            new_copy[id(p)] = q
+
+    if algorithm == "FCFS":
+        results = _materialize(sub, _fcfs_slices(arrival, burst, resume_time), copies)
+    elif algorithm in ("SJF", "Priority"):
+        key = burst if algorithm == "SJF" else [p.priority for p in sub]
+        results = _materialize(sub, _non_preemptive_slices(arrival, burst, key, resume_time), copies)
+    elif algorithm == "RR":
+        # At a decision the queue holds every arrived, unfinished process in
+        # the order previous goes on to serve them
+        position = {id(p): k for k, p in enumerate(active)}
+        ready = [position[copy_id] for copy_id, p in old_copies.items() if p.arrival_time <= resume_time]
+        slices = _round_robin_slices(arrival, [q.remaining_time for q in copies], quantum,
+                                     resume=(resume_time, ready), **options)
+        results = _materialize(sub, slices, copies)
+    else:
+        key = _remaining_key if algorithm == "SRTF" else _priority_key
+        results = _preemptive(sub, key, resume=(resume_time, copies))
+
+    # Earlier slices of processes that already ran move to their new copies
+    first = bisect.bisect_left(starts, min((q.arrival_time + q.response_time for q in new_copy.values()),
+                                           default=resume_time), 0, cut)
+    window = [(new_copy.get(id(p), p), start, end) for p, start, end in previous[first:cut]]
+    return previous[:first] + window + results
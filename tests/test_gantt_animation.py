@@ -0,0 +1,41 @@
+"""BlittedGantt reveals bars and context switches as time passes, backwards too"""
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from gantt_animation import BlittedGantt
+from scheduling_engine import ContextSwitches, round_robin, Process
+
+
+def make_gantt():
+    switches = ContextSwitches(1)
+    results = round_robin([Process("A", 0, 4), Process("B", 0, 3)], 2, switches=switches)
+    figure = Figure(figsize=(8, 2), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    gantt = BlittedGantt(figure, canvas, [results], "RR", [(s, e, 0) for s, e, _ in switches.intervals])
+    return gantt, switches.intervals
+
+
+def hatched_widths(gantt):
+    return [bar.get_width() if bar.get_visible() else None for bar in gantt.bars if bar.get_hatch()]
+
+
+def test_switches_are_revealed_like_bars():
+    gantt, intervals = make_gantt()
+    assert len(hatched_widths(gantt)) == len(intervals) > 0
+    assert hatched_widths(gantt) == [None] * len(intervals)
+
+    start, end, _ = intervals[0]
+    gantt.update(start + 0.5)
+    assert hatched_widths(gantt)[0] == 0.5
+    gantt.update(end)
+    assert hatched_widths(gantt)[0] == end - start
+    assert not next(bar for bar in gantt.bars if bar.get_hatch()).get_animated()
+
+    last = max(e for _, e, _ in intervals)
+    gantt.update(last + 1)
+    assert hatched_widths(gantt) == [e - s for s, e, _ in intervals]
+
+    gantt.seek(start)
+    assert hatched_widths(gantt) == [None] * len(intervals)
@@ -0,0 +1,85 @@
+"""LodGantt draws every slice when few are in view and a per-pixel summary otherwise"""
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+from gantt_render import LodGantt
+from scheduling_engine import Process, round_robin
+
+
+def make_axes(xlim):
+    figure = Figure(figsize=(8, 2), dpi=100)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    ax.set_ylim(-0.5, 0.5)
+    ax.set_xlim(*xlim)
+    return ax
+
+
+def drawn_bars(ax):
+    """(start, end, facecolor) of every bar in the slice collections"""
+    bars = []
+    for collection in ax.collections:
+        if isinstance(collection, PolyCollection) and collection.get_hatch() is None:
+            color = tuple(collection.get_facecolor()[0])
+            for path in collection.get_paths():
+                xs = path.vertices[:, 0]
+                bars.append((float(xs.min()), float(xs.max()), color))
+    return sorted(bars)
+
+
+def schedule(size, quantum=1):
+    # Two busy periods separated by an idle gap from 5 * size to 20 * size
+    processes = [Process(f"P{i}", 0, 5) for i in range(size)]
+    processes += [Process(f"Q{i}", 20 * size, 5) for i in range(size)]
+    return round_robin(processes, quantum)
+
+
+def test_few_slices_are_drawn_one_to_one():
+    results = schedule(5)
+    ax = make_axes((0, 200))
+    gantt = LodGantt(ax, [results])
+    expected = [(start, end, tuple(gantt.colors[gantt.pid_labels.index(p.pid)]))
+                for p, start, end in sorted(results, key=lambda r: r[1])]
+    assert drawn_bars(ax) == expected
+
+
+def test_many_slices_are_binned_per_pixel_column():
+    size = 4000
+    results = schedule(size)
+    end = max(e for _, _, e in results)
+    ax = make_axes((0, end))
+    LodGantt(ax, [results], max_detail=2000)
+    bars = drawn_bars(ax)
+    assert 0 < len(bars) <= int(ax.bbox.width)
+    assert not ax.texts  # bars a pixel wide get no labels
+    # Bars stay within the busy periods, up to one pixel column of rounding
+    column = end / int(ax.bbox.width)
+    assert all(e <= 5 * size + column or s >= 20 * size - column for s, e, _ in bars)
+    assert bars[0][0] == 0 and bars[-1][1] >= end - column
+
+
+def test_zooming_in_restores_full_detail():
+    results = schedule(4000)
+    ax = make_axes((0, max(e for _, _, e in results)))
+    LodGantt(ax, [results], max_detail=2000)
+    ax.set_xlim(100, 300)
+    in_view = sorted((s, e) for _, s, e in results if e > 100 and s < 300)
+    assert [(start, end) for start, end, _ in drawn_bars(ax)] == in_view
+
+
+def test_labels_only_on_wide_bars():
+    results = round_robin([Process("Wide", 0, 100), Process("Thin", 100, 1)], 100)
+    ax = make_axes((0, 101))
+    LodGantt(ax, [results], label_px=24)
+    assert [text.get_text() for text in ax.texts] == ["Wide"]
+
+
+def test_context_switches_are_hatched():
+    results = [(Process("A", 0, 2), 1, 3), (Process("B", 0, 2), 4, 6)]
+    ax = make_axes((0, 10))
+    LodGantt(ax, [results], switches=[(0, 1, 0), (3, 4, 0), (6, 6, 0)])
+    hatched = [c for c in ax.collections if c.get_hatch()]
+    assert len(hatched) == 1 and len(hatched[0].get_paths()) == 2  # the empty switch is skipped
@@ -0,0 +1,58 @@
+"""reschedule() must give the same schedule as a full run_algorithm() run"""
+import random
+
+import pytest
+
+from scheduling_engine import Process, RESUMABLE_ALGORITHMS, ContextSwitches, run_algorithm, reschedule
+
+CASES = [(algorithm, {}) for algorithm in sorted(RESUMABLE_ALGORITHMS - {"RR"})]
+CASES += [("RR", {"coalesce": False}), ("RR", {"coalesce": True}), ("MLFQ", {})]
+
+
+def signature(results):
+    """Slices plus final metrics, with Process objects numbered by identity"""
+    ids = {}
+    return [(p.pid, ids.setdefault(id(p), len(ids)), start, end, p.completion_time, p.turnaround_time,
+             p.waiting_time, p.response_time, p.remaining_time) for p, start, end in results]
+
+
+def random_processes(rng):
+    # Few pids, short bursts and close arrivals so ties and duplicates are common
+    processes = [Process(f"P{rng.randint(0, 2)}", rng.randint(0, 15), rng.randint(1, 4), rng.randint(0, 1))
+                 for _ in range(rng.randint(1, 12))]
+    if rng.random() < 0.2:
+        first = processes[0]
+        processes.append(Process(first.pid, first.arrival_time, first.burst_time, first.priority))
+    return processes
+
+
+@pytest.mark.parametrize("algorithm,options", CASES)
+def test_reschedule_matches_full_run(algorithm, options):
+    rng = random.Random(algorithm + repr(options))
+    for _ in range(500):
+        processes = random_processes(rng)
+        split = rng.randint(0, len(processes) - 1)
+        quantum = rng.randint(1, 4) if algorithm == "RR" else None
+        previous = run_algorithm(algorithm, processes[:split], quantum, **options)
+        full = run_algorithm(algorithm, processes, quantum, **options)
+        incremental = reschedule(algorithm, processes[:split], previous, processes[split:], quantum, **options)
+        assert signature(incremental) == signature(full)
+
+
+def test_reschedule_reuses_the_prefix():
+    processes = [Process("A", 0, 5), Process("B", 1, 5)]
+    previous = run_algorithm("FCFS", processes)
+    results = reschedule("FCFS", processes, previous, [Process("C", 20, 2)])
+    assert results[0][0] is previous[0][0] and results[1][0] is previous[1][0]
+    assert [(p.pid, start, end) for p, start, end in results] == [("A", 0, 5), ("B", 5, 10), ("C", 20, 22)]
+
+
+def test_reschedule_with_switch_costs_runs_in_full():
+    processes = [Process("A", 0, 3), Process("B", 1, 2)]
+    previous = run_algorithm("RR", processes, 1, switches=ContextSwitches(1))
+    switches = ContextSwitches(1)
+    results = reschedule("RR", processes, previous, [Process("C", 2, 2)], 1, switches=switches)
+    expected_switches = ContextSwitches(1)
+    expected = run_algorithm("RR", processes + [Process("C", 2, 2)], 1, switches=expected_switches)
+    assert signature(results) == signature(expected)
+    assert switches.intervals == expected_switches.intervals
@@ -0,0 +1,112 @@
+"""Vectorized metrics must agree with the per-Process fields the engine fills in"""
+import csv
+import random
+
+import numpy as np
+import pytest
+
+from scheduling_engine import (ALGORITHMS, QUANTUM_ALGORITHMS, Process, Workload, ContextSwitches, run_algorithm,
+                               schedule_workload, smp, merge_lanes, io_schedule)
+from schedule_metrics import (METRIC_COLUMNS, to_columns, workload_columns, compute_metrics, summarize,
+                              export_metrics)
+
+
+def random_processes(rng, size=40):
+    return [Process(f"P{i % 7}", rng.randint(0, 3 * size), rng.randint(1, 9), rng.randint(0, 4))
+            for i in range(size)]
+
+
+def per_process(results):
+    """Each distinct Process once, in order of first slice"""
+    return list({id(p): p for p, _, _ in results}.values())
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_metrics_match_process_fields(algorithm):
+    rng = random.Random(algorithm)
+    for _ in range(50):
+        results = run_algorithm(algorithm, random_processes(rng), 3 if algorithm in QUANTUM_ALGORITHMS else None)
+        columns = to_columns(results)
+        metrics = compute_metrics(columns)
+        processes = per_process(results)
+        assert columns.pids == [p.pid for p in processes]
+        assert metrics["completion"].tolist() == [p.completion_time for p in processes]
+        assert metrics["turnaround"].tolist() == [p.turnaround_time for p in processes]
+        assert metrics["waiting"].tolist() == [p.waiting_time for p in processes]
+        assert metrics["response"].tolist() == [p.response_time for p in processes]
+
+
+def test_workload_columns_match_process_columns():
+    rng = random.Random(0)
+    processes = [Process(f"P{i}", rng.randint(0, 600), rng.randint(1, 9)) for i in range(200)]
+    workload = Workload.from_processes(processes)
+    metrics = compute_metrics(workload_columns(workload, schedule_workload(workload, "RR", 2)))
+    # Workload rows keep the input order
+    by_pid = {p.pid: p for p, _, _ in run_algorithm("RR", processes, 2)}
+    expected = [by_pid[pid] for pid in workload.pids]
+    assert metrics["completion"].tolist() == [p.completion_time for p in expected]
+    assert metrics["waiting"].tolist() == [p.waiting_time for p in expected]
+    assert metrics["response"].tolist() == [p.response_time for p in expected]
+
+
+def test_summary():
+    processes = [Process("A", 0, 4), Process("B", 1, 2), Process("C", 10, 2)]
+    results = run_algorithm("FCFS", processes)
+    columns = to_columns(results)
+    summary = summarize(columns, compute_metrics(columns))
+    waiting = [p.waiting_time for p, _, _ in results]
+    assert waiting == [0, 3, 0]
+    assert summary["processes"] == 3 and summary["slices"] == 3
+    assert summary["makespan"] == 12
+    assert summary["avg_waiting"] == pytest.approx(1.0)
+    assert summary["avg_turnaround"] == pytest.approx((4 + 5 + 2) / 3)
+    assert summary["p95_waiting"] == pytest.approx(np.percentile(waiting, 95))
+    assert summary["max_waiting"] == 3
+    assert summary["throughput"] == pytest.approx(3 / 12)
+    assert summary["cpu_utilization"] == pytest.approx(8 / 12)
+    assert summary["context_switches"] == 0
+    assert summarize(to_columns([]), compute_metrics(to_columns([]))) == {}
+
+
+def test_summary_with_switches_and_cpus():
+    processes = random_processes(random.Random(1), 100)
+    switches = ContextSwitches(1)
+    lanes = smp(processes, 2, "RR", 2, switches=switches)
+    columns = to_columns(merge_lanes(lanes))
+    summary = summarize(columns, compute_metrics(columns), 2, switches.intervals)
+    busy = sum(end - start for lane in lanes for _, start, end in lane)
+    assert summary["context_switches"] == len(switches)
+    assert summary["switch_overhead"] == switches.overhead
+    assert summary["cpu_utilization"] == pytest.approx(busy / (summary["makespan"] * 2))
+    assert summary["cpu_busy"] == pytest.approx((busy + switches.overhead) / (summary["makespan"] * 2))
+
+
+def test_export_metrics(tmp_path):
+    results = run_algorithm("SJF", random_processes(random.Random(2)))
+    columns = to_columns(results)
+    metrics = compute_metrics(columns)
+
+    export_metrics(columns, metrics, str(tmp_path / "metrics.csv"))
+    with open(tmp_path / "metrics.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == METRIC_COLUMNS
+    assert [row[0] for row in rows[1:]] == columns.pids
+    assert [int(row[5]) for row in rows[1:]] == metrics["waiting"].tolist()
+
+    export_metrics(columns, metrics, str(tmp_path / "metrics.npz"))
+    with np.load(tmp_path / "metrics.npz") as data:
+        assert sorted(data.files) == sorted(METRIC_COLUMNS)
+        assert data["response"].tolist() == metrics["response"].tolist()
+
+
+def test_io_time_only_counts_for_io_schedules():
+    processes = [Process("A", 0, None, bursts=[5, 10, 5]), Process("B", 1, 3)]
+    results = run_algorithm("FCFS", processes)
+    metrics = compute_metrics(to_columns(results))
+    # Without I/O simulation the bursts run back to back
+    assert metrics["waiting"].tolist() == [p.waiting_time for p in per_process(results)] == [0, 9]
+
+    results, _ = io_schedule(processes, "FCFS")
+    metrics = compute_metrics(to_columns(results, io=True))
+    assert metrics["waiting"].tolist() == [p.waiting_time for p in per_process(results)]
+    assert min(metrics["waiting"]) >= 0
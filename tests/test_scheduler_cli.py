@@ -0,0 +1,81 @@
+"""Headless runs: Workload and streaming paths agree with the Process path, no GUI imports"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import scheduler_cli
+from scheduling_engine import WORKLOAD_ALGORITHMS, Process, ContextSwitches
+from workload_gen import generate
+from workload_io import iter_trace, load_workload, write_trace
+
+
+@pytest.fixture
+def trace(tmp_path):
+    path = str(tmp_path / "trace.csv")
+    write_trace(generate(3000, seed=4), path)
+    return path
+
+
+def without_seconds(summary):
+    return {name: value for name, value in summary.items() if name != "seconds"}
+
+
+@pytest.mark.parametrize("algorithm", WORKLOAD_ALGORITHMS)
+def test_workload_path_matches_process_path(trace, algorithm):
+    quantum = 3 if algorithm == "RR" else None
+    _, expected = scheduler_cli.run(algorithm, list(iter_trace(trace)), quantum, switches=ContextSwitches(1))
+    lanes, summary = scheduler_cli.run_workload(algorithm, load_workload(trace), quantum, ContextSwitches(1))
+    assert lanes is None
+    assert without_seconds(summary) == without_seconds(expected)
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "RR"])
+def test_stream_matches_loaded_trace(trace, algorithm, tmp_path):
+    loaded, streamed = str(tmp_path / "loaded.json"), str(tmp_path / "streamed.json")
+    scheduler_cli.main(["--algo", algorithm, "--input", trace, "--out", loaded])
+    scheduler_cli.main(["--stream", "--algo", algorithm, "--input", trace, "--out", streamed])
+    with open(loaded) as f, open(streamed) as g:
+        assert [without_seconds(row) for row in json.load(f)] == [without_seconds(row) for row in json.load(g)]
+
+
+def test_bursts_without_io_devices(tmp_path):
+    path = tmp_path / "io.jsonl"
+    path.write_text('{"pid": "A", "arrival": 0, "bursts": [5, 10, 5]}\n{"pid": "B", "arrival": 1, "burst": 3}\n')
+    out = str(tmp_path / "out.json")
+    scheduler_cli.main(["--algo", "FCFS", "--input", str(path), "--out", out])
+    with open(out) as f:
+        row = json.load(f)[0]
+    assert row["avg_waiting"] == 4.5 and row["max_waiting"] == 9
+
+
+def test_headless_does_not_import_the_gui(trace):
+    code = ("import sys, cpu_scheduler_gui; cpu_scheduler_gui.main(['--headless', '--input', sys.argv[1]]); "
+            "assert 'tkinter' not in sys.modules and 'matplotlib' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code, trace], check=True, capture_output=True,
+                   cwd=os.path.dirname(os.path.abspath(scheduler_cli.__file__)))
+
+
+def test_gui_class_is_importable():
+    pytest.importorskip("tkinter")
+    import cpu_scheduler_gui
+    from scheduler_window import CPUSchedulerGUI
+    assert cpu_scheduler_gui.CPUSchedulerGUI is CPUSchedulerGUI
+
+
+def test_process_is_importable_from_the_gui_module():
+    from cpu_scheduler_gui import Process as GuiProcess
+    assert GuiProcess is Process
+
+
+def test_io_summary_spans_context_switches():
+    processes = [Process("A", 0, None, bursts=[3, 5, 2]), Process("B", 0, 4)]
+    _, summary = scheduler_cli.run("FCFS", processes, switches=ContextSwitches(2), io_devices=1)
+    # Three switches of 2 plus 9 units of CPU work: the CPU is never idle
+    assert summary["makespan"] == 15
+    assert summary["throughput"] == pytest.approx(2 / 15)
+    assert summary["cpu_utilization"] == pytest.approx(9 / 15)
+    assert summary["cpu_busy"] == pytest.approx(1.0)
+    assert summary["io_utilization"] == [pytest.approx(5 / 15)]
@@ -0,0 +1,331 @@
+"""Engine schedules against the original per-object algorithms, and the Workload path against both"""
+import random
+from collections import deque
+
+import numpy as np
+import pytest
+
+from scheduling_engine import (Process, Workload, ContextSwitches, WORKLOAD_ALGORITHMS, run_algorithm,
+                               schedule_workload, workload_results, mlfq, round_robin)
+
+
+def reference_non_preemptive(processes, key):
+    """The original SJF/Priority loop: scan the arrived processes, run the minimum"""
+    remaining = sorted(processes, key=lambda p: p.arrival_time)
+    current_time = 0
+    results = []
+    while remaining:
+        available = [p for p in remaining if p.arrival_time <= current_time]
+        if not available:
+            current_time = remaining[0].arrival_time
+            continue
+        p = min(available, key=key)
+        remaining.remove(p)
+        results.append((p.pid, current_time, current_time + p.burst_time))
+        current_time += p.burst_time
+    return results
+
+
+def reference_round_robin(processes, quantum):
+    """The original Round Robin: arrivals join the queue before the preempted process
+
+    Unlike the original, the clock starts at the first arrival (it used to
+    run the first process from time 0 even when it arrived later).
+    """
+    remaining = deque(sorted(processes, key=lambda p: p.arrival_time))
+    left = {p.pid: p.burst_time for p in processes}
+    current_time = remaining[0].arrival_time
+    ready_queue = deque([remaining.popleft()])
+    results = []
+    while ready_queue or remaining:
+        if not ready_queue:
+            current_time = remaining[0].arrival_time
+            ready_queue.append(remaining.popleft())
+        p = ready_queue.popleft()
+        execution_time = min(quantum, left[p.pid])
+        left[p.pid] -= execution_time
+        results.append((p.pid, current_time, current_time + execution_time))
+        current_time += execution_time
+        while remaining and remaining[0].arrival_time <= current_time:
+            ready_queue.append(remaining.popleft())
+        if left[p.pid] > 0:
+            ready_queue.append(p)
+    return results
+
+
+REFERENCES = {
+    "FCFS": lambda processes, quantum: reference_non_preemptive(processes, key=lambda p: 0),
+    "SJF": lambda processes, quantum: reference_non_preemptive(processes, key=lambda p: p.burst_time),
+    "Priority": lambda processes, quantum: reference_non_preemptive(processes, key=lambda p: p.priority),
+    "RR": reference_round_robin,
+}
+
+
+def random_processes(rng, size=None):
+    # Unique pids (the original RR keyed its copies by pid), many ties
+    size = rng.randint(1, 30) if size is None else size
+    return [Process(f"P{i}", rng.randint(0, size), rng.randint(1, 8), rng.randint(0, 4)) for i in range(size)]
+
+
+def slices(results):
+    return [(p.pid, start, end) for p, start, end in results]
+
+
+def workload_slices(workload, schedule):
+    return [(workload.pids[i], start, end) for i, start, end in zip(schedule.index, schedule.start, schedule.end)]
+
+
+def test_process_has_no_instance_dict():
+    p = Process("P1", 0, 5)
+    assert not hasattr(p, "__dict__")
+    with pytest.raises(AttributeError):
+        p.color = "red"
+
+
+@pytest.mark.parametrize("algorithm", WORKLOAD_ALGORITHMS)
+def test_matches_original_algorithms(algorithm):
+    rng = random.Random(algorithm)
+    for _ in range(200):
+        processes = random_processes(rng)
+        quantum = rng.randint(1, 4) if algorithm == "RR" else None
+        results = run_algorithm(algorithm, processes, quantum)
+        assert slices(results) == REFERENCES[algorithm](processes, quantum)
+        for p, _, _ in results:
+            assert p.remaining_time == 0
+            assert p.completion_time == max(end for q, _, end in results if q is p)
+            assert p.waiting_time == p.completion_time - p.arrival_time - p.burst_time
+
+
+WORKLOAD_CASES = [(algorithm, options) for algorithm in WORKLOAD_ALGORITHMS for options in ({}, {"switch_cost": 2})]
+WORKLOAD_CASES += [("RR", {"coalesce": True}), ("Priority", {"aging": 3})]
+
+
+@pytest.mark.parametrize("algorithm,options", WORKLOAD_CASES)
+def test_workload_matches_process_path(algorithm, options):
+    rng = random.Random(algorithm + repr(options))
+    for _ in range(100):
+        processes = random_processes(rng)
+        quantum = rng.randint(1, 4) if algorithm == "RR" else None
+        kwargs = dict(options)
+        cost = kwargs.pop("switch_cost", None)
+        process_switches = ContextSwitches(cost, "uniform", seed=1) if cost else None
+        workload_switches = ContextSwitches(cost, "uniform", seed=1) if cost else None
+
+        expected = run_algorithm(algorithm, processes, quantum, switches=process_switches, **kwargs)
+        workload = Workload.from_processes(processes)
+        schedule = schedule_workload(workload, algorithm, quantum, switches=workload_switches, **kwargs)
+        assert workload_slices(workload, schedule) == slices(expected)
+        if cost:
+            assert workload_switches.intervals == process_switches.intervals
+
+
+def test_workload_results_fill_in_metrics():
+    processes = random_processes(random.Random(0), 50)
+    workload = Workload.from_processes(processes)
+    results = workload_results(workload, schedule_workload(workload, "RR", 2))
+    expected = run_algorithm("RR", processes, 2)
+    metrics = lambda rs: [(p.pid, s, e, p.completion_time, p.waiting_time, p.response_time) for p, s, e in rs]
+    assert metrics(results) == metrics(expected)
+
+
+def test_workload_round_trip():
+    processes = random_processes(random.Random(1), 20)
+    workload = Workload.from_processes(processes)
+    assert len(workload) == 20
+    assert [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in workload] == \
+        [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
+    with pytest.raises(ValueError):
+        Workload(["P1", "P2"], [0], [1, 2])
+
+
+def test_workload_rejects_other_algorithms():
+    with pytest.raises(ValueError):
+        schedule_workload(Workload(["P1"], [0], [1]), "SRTF")
+
+
+def reference_aged_priority(processes, aging, preemptive):
+    """Tick-by-tick Priority where waiting `aging` units is worth one level
+
+    A ready process's level is its base level minus the whole `aging`
+    periods it has waited since it last became ready; ties go to the
+    smaller priority * aging + ready time, then to arrival order. With
+    preemption, the running process keeps its dispatch level and is
+    preempted by a strictly better one.
+    """
+    order = sorted(range(len(processes)), key=lambda i: processes[i].arrival_time)
+    remaining = {i: processes[i].burst_time for i in order}
+    ready = {}  # position -> (level, ready time)
+    current_time, upcoming, running, level, results = 0, 0, None, None, []
+
+    def best():
+        return min(ready, key=lambda k: (ready[k][0] - (current_time - ready[k][1]) // aging,
+                                         ready[k][0] * aging + ready[k][1], k))
+
+    while remaining:
+        while upcoming < len(order) and processes[order[upcoming]].arrival_time <= current_time:
+            ready[upcoming] = (processes[order[upcoming]].priority, processes[order[upcoming]].arrival_time)
+            upcoming += 1
+        if running is not None and preemptive and ready:
+            k = best()
+            if ready[k][0] - (current_time - ready[k][1]) // aging < level:
+                ready[running] = (level, current_time)
+                running = None
+        if running is None:
+            if not ready:
+                current_time = processes[order[upcoming]].arrival_time
+                continue
+            running = best()
+            base, since = ready.pop(running)
+            level = base - (current_time - since) // aging
+        run_for = 1 if preemptive else remaining[order[running]]
+        pid = processes[order[running]].pid
+        if results and results[-1][0] == pid and results[-1][2] == current_time:
+            results[-1] = (pid, results[-1][1], current_time + run_for)
+        else:
+            results.append((pid, current_time, current_time + run_for))
+        current_time += run_for
+        remaining[order[running]] -= run_for
+        if not remaining[order[running]]:
+            del remaining[order[running]]
+            running = None
+    return results
+
+
+@pytest.mark.parametrize("algorithm", ["Priority", "Priority-P"])
+def test_aging_matches_tick_reference(algorithm):
+    rng = random.Random(algorithm)
+    for _ in range(200):
+        processes = [Process(f"P{i}", rng.randint(0, 40), rng.randint(1, 8), rng.randint(0, 6))
+                     for i in range(rng.randint(1, 15))]
+        aging = rng.choice([1, 2, 3, 5, 10])
+        assert slices(run_algorithm(algorithm, processes, aging=aging)) == \
+            reference_aged_priority(processes, aging, algorithm == "Priority-P")
+
+
+def test_aging_must_be_a_positive_int():
+    processes = [Process("A", 0, 3, 2), Process("B", 1, 2, 0)]
+    for aging in (2.5, 0, -1, True):
+        with pytest.raises(ValueError):
+            run_algorithm("Priority", processes, aging=aging)
+        with pytest.raises(ValueError):
+            run_algorithm("Priority-P", processes, aging=aging)
+    assert slices(run_algorithm("Priority", processes, aging=np.int64(2))) == \
+        slices(run_algorithm("Priority", processes, aging=2))
+
+
+def reference_mlfq(processes, quanta, allotments, boost_interval, switches):
+    """Tick-by-tick MLFQ
+
+    A slice ends after quanta[level] ticks or once the level's allotment is
+    used up (then the process is demoted). An arrival preempts a process
+    below level 0 and a boost preempts any; a preempted process goes back
+    to the front of its level. Arrivals at a slice's end queue before it.
+    After a context switch the choice is made again if a higher level
+    filled up or a boost fell due during the switch.
+    """
+    order = sorted(range(len(processes)), key=lambda i: processes[i].arrival_time)
+    remaining = [p.burst_time for p in processes]
+    used = [0] * len(processes)
+    queues = [deque() for _ in quanta]
+    last = len(quanta) - 1
+    current_time, upcoming, next_boost, loaded, running, results = 0, 0, boost_interval, None, None, []
+    if switches is not None:
+        switches.reset()
+
+    def admit():
+        nonlocal upcoming
+        admitted = False
+        while upcoming < len(order) and processes[order[upcoming]].arrival_time <= current_time:
+            queues[0].append(order[upcoming])
+            upcoming += 1
+            admitted = True
+        return admitted
+
+    def boost_due():
+        return next_boost is not None and next_boost <= current_time
+
+    while upcoming < len(order) or any(queues) or running is not None:
+        if running is None:
+            if not any(queues):
+                current_time = max(current_time, processes[order[upcoming]].arrival_time)
+            if boost_due():
+                for lower in queues[1:]:
+                    queues[0].extend(lower)
+                    lower.clear()
+                for i in queues[0]:
+                    used[i] = 0
+                next_boost = (current_time // boost_interval + 1) * boost_interval
+            admit()
+            level = next(lvl for lvl, queue in enumerate(queues) if queue)
+            i = queues[level].popleft()
+            if switches is not None and i != loaded:
+                current_time = switches.switch(current_time)
+                loaded = i
+                admit()
+                if any(queues[:level]) or boost_due():
+                    queues[level].appendleft(i)
+                    continue
+            running, ticks = i, 0
+
+        pid = processes[running].pid
+        if results and results[-1][0] == pid and results[-1][2] == current_time:
+            results[-1] = (pid, results[-1][1], current_time + 1)
+        else:
+            results.append((pid, current_time, current_time + 1))
+        current_time += 1
+        remaining[running] -= 1
+        used[running] += 1
+        ticks += 1
+        arrived = admit()
+
+        if not remaining[running]:
+            running = None
+        elif level < last and used[running] >= allotments[level]:
+            used[running] = 0
+            queues[level + 1].append(running)
+            running = None
+        elif ticks == quanta[level]:
+            queues[level].append(running)
+            running = None
+        elif (arrived and level > 0) or boost_due():
+            queues[level].appendleft(running)
+            running = None
+    return results
+
+
+MLFQ_CASES = [
+    {"quanta": (2, 4, 8)},
+    {"quanta": (1, 3), "allotments": (4, 3)},
+    {"quanta": (2, 3, 5), "allotments": (5, 7, 1), "boost_interval": 13},
+    {"quanta": (3,), "boost_interval": 7},
+    {"quanta": (2, 4, 8), "boost_interval": 20, "switch_cost": 1},
+    {"quanta": (1, 2, 4), "allotments": (3, 5, 4), "boost_interval": 9, "switch_cost": 2},
+]
+
+
+@pytest.mark.parametrize("options", MLFQ_CASES)
+def test_mlfq_matches_tick_reference(options):
+    rng = random.Random(repr(options))
+    kwargs = dict(options)
+    cost = kwargs.pop("switch_cost", None)
+    for _ in range(200):
+        processes = [Process(f"P{i}", rng.randint(0, 40), rng.randint(1, 20)) for i in range(rng.randint(1, 12))]
+        switches = ContextSwitches(cost, "uniform", seed=3) if cost else None
+        reference_switches = ContextSwitches(cost, "uniform", seed=3) if cost else None
+        expected = reference_mlfq(processes, kwargs["quanta"], kwargs.get("allotments", kwargs["quanta"]),
+                                  kwargs.get("boost_interval"), reference_switches)
+        assert slices(mlfq(processes, switches=switches, **kwargs)) == expected
+        if cost:
+            assert switches.intervals == reference_switches.intervals
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 5])
+def test_one_level_mlfq_is_round_robin(quantum):
+    rng = random.Random(quantum)
+    for _ in range(100):
+        processes = random_processes(rng)
+        assert slices(mlfq(processes, quanta=(quantum,))) == slices(round_robin(processes, quantum, coalesce=True))
+        switches, rr_switches = ContextSwitches(1), ContextSwitches(1)
+        assert slices(mlfq(processes, quanta=(quantum,), switches=switches)) == \
+            slices(round_robin(processes, quantum, coalesce=True, switches=rr_switches))
+        assert switches.intervals == rr_switches.intervals
@@ -0,0 +1,38 @@
+"""Synthetic workloads are reproducible, well formed and may be empty"""
+import pytest
+
+from workload_gen import ARRIVALS, BURSTS, PRIORITIES, generate, batches
+
+
+@pytest.mark.parametrize("arrivals", ARRIVALS)
+@pytest.mark.parametrize("bursts", BURSTS)
+def test_generated_columns(arrivals, bursts):
+    workload = generate(2000, seed=3, arrivals=arrivals, bursts=bursts)
+    assert len(workload) == 2000
+    assert list(workload.arrival) == sorted(workload.arrival)
+    assert min(workload.burst) >= 1
+    assert all(0 <= p < 10 for p in workload.priority)
+    again = generate(2000, seed=3, arrivals=arrivals, bursts=bursts)
+    assert (again.pids, again.arrival, again.burst, again.priority) == \
+        (workload.pids, workload.arrival, workload.burst, workload.priority)
+
+
+@pytest.mark.parametrize("priorities", PRIORITIES)
+def test_empty_workload(priorities):
+    for arrivals in ARRIVALS:
+        assert len(generate(0, arrivals=arrivals, priorities=priorities)) == 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        generate(-1)
+    with pytest.raises(ValueError):
+        generate(10, arrivals="weekly")
+    with pytest.raises(ValueError):
+        generate(10, bursts="pareto", pareto_shape=1)
+
+
+def test_batches_and_pids():
+    workload = generate(25, first_pid=5)
+    assert workload.pids[0] == "P5" and workload.pids[-1] == "P29"
+    assert [len(batch) for batch in batches(workload, 10)] == [10, 10, 5]
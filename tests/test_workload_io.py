@@ -0,0 +1,74 @@
+"""Trace files round-trip, and the lazy FCFS/RR streams match the in-memory schedulers"""
+import random
+
+import pytest
+
+from scheduling_engine import Process, fcfs, round_robin, fcfs_stream, round_robin_stream
+from schedule_metrics import to_columns, compute_metrics, summarize, summarize_stream
+from workload_io import iter_trace, load_workload, write_trace
+
+
+def random_processes(rng, size=60):
+    processes = []
+    arrival = 0
+    for i in range(size):
+        arrival += rng.randint(0, 4)
+        bursts = [rng.randint(1, 6) for _ in range(2 * rng.randint(0, 2) + 1)] if rng.random() < 0.3 else None
+        processes.append(Process(f"P{i}", arrival, None if bursts else rng.randint(1, 9), rng.randint(0, 4), bursts))
+    return processes
+
+
+def fields(processes):
+    return [(p.pid, p.arrival_time, p.burst_time, p.priority, p.bursts) for p in processes]
+
+
+@pytest.mark.parametrize("name", ["trace.csv", "trace.jsonl"])
+def test_trace_round_trip(tmp_path, name):
+    processes = random_processes(random.Random(name))
+    path = str(tmp_path / name)
+    write_trace(processes, path)
+    assert fields(iter_trace(path)) == fields(processes)
+
+    workload = load_workload(path)
+    assert workload.pids == [p.pid for p in processes]
+    assert list(workload.burst) == [p.burst_time for p in processes]
+
+
+def test_trace_errors(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("pid,arrival,burst\nP1,0,0\n")
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_trace(str(path)))
+    path.write_text("pid,arrival\nP1,0\n")
+    with pytest.raises(ValueError, match="missing 'burst'"):
+        list(iter_trace(str(path)))
+
+
+def slices(results):
+    return [(p.pid, start, end, p.completion_time, p.waiting_time, p.response_time) for p, start, end in results]
+
+
+@pytest.mark.parametrize("quantum,coalesce", [(None, False), (1, False), (3, False), (3, True)])
+def test_streams_match_full_runs(quantum, coalesce):
+    rng = random.Random(repr((quantum, coalesce)))
+    for _ in range(50):
+        processes = random_processes(rng)
+        if quantum is None:
+            streamed = list(fcfs_stream(iter(processes)))
+            expected = fcfs(processes)
+        else:
+            streamed = list(round_robin_stream(iter(processes), quantum, coalesce))
+            expected = round_robin(processes, quantum, coalesce)
+        assert slices(streamed) == slices(expected)
+
+        columns = to_columns(expected)
+        summary = summarize(columns, compute_metrics(columns))
+        stream_summary = summarize_stream(round_robin_stream(iter(processes), quantum, coalesce)
+                                          if quantum else fcfs_stream(iter(processes)))
+        assert stream_summary == pytest.approx(summary)
+
+
+def test_stream_needs_arrival_order():
+    with pytest.raises(ValueError, match="not sorted"):
+        list(fcfs_stream([Process("A", 5, 1), Process("B", 1, 1)]))
+    assert summarize_stream(fcfs_stream([])) == {}
@@ -0,0 +1,106 @@
+"""Virtualized ttk.Treeview: shows a window of rows from a backing sequence"""
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTable(tk.Frame):
+    """Table that keeps only `height` Treeview items, whatever the number of rows
+
+    columns is a list of (heading, width, sort_key); sort_key(row) is used
+    when the heading is clicked (None makes the column unsortable).
+    row_values(row) returns the cell values of one row. Scrolling rewrites
+    the values of the visible items from the backing sequence, so loading
+    or sorting 100k rows costs no widget work.
+    """
+    def __init__(self, parent, columns, row_values, height=10, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.columns = columns
+        self.row_values = row_values
+        self.height = height
+        self.rows = []
+        self.order = None  # row indices in display order while sorted
+        self.sort_column = None
+        self.sort_reverse = False
+        self.offset = 0
+
+        names = [f"c{i}" for i in range(len(columns))]
+        self.tree = ttk.Treeview(self, columns=names, show='headings', height=height,
+                                 selectmode='none')
+        for i, (heading, width, sort_key) in enumerate(columns):
+            command = (lambda i=i: self.sort_by(i)) if sort_key else ''
+            self.tree.heading(names[i], text=heading, command=command)
+            self.tree.column(names[i], width=width, anchor='center', stretch=True)
+        self.scrollbar = tk.Scrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_wheel)
+
+    def set_rows(self, rows):
+        """Show a new backing sequence (kept by reference, not copied)"""
+        self.rows = rows
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the backing sequence after rows were added or removed"""
+        if self.sort_column is not None:
+            self._sort()
+        self._render()
+
+    def sort_by(self, column):
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self._sort()
+        self.offset = 0
+        self._render()
+
+    def _sort(self):
+        sort_key = self.columns[self.sort_column][2]
+        rows = self.rows
+        self.order = sorted(range(len(rows)), key=lambda i: sort_key(rows[i]), reverse=self.sort_reverse)
+
+    def _row(self, position):
+        return self.rows[self.order[position] if self.order is not None else position]
+
+    def _render(self):
+        total = len(self.rows)
+        self.offset = max(0, min(self.offset, total - self.height))
+        visible = min(self.height, total - self.offset)
+
+        items = self.tree.get_children()
+        for item in items[visible:]:
+            self.tree.delete(item)
+        for k in range(visible):
+            values = self.row_values(self._row(self.offset + k))
+            if k < len(items):
+                self.tree.item(items[k], values=values)
+            else:
+                self.tree.insert('', tk.END, values=values)
+
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + visible) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_to(self, offset):
+        self.offset = int(offset)
+        self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.rows))
+        elif unit == 'pages':
+            self.scroll_to(self.offset + int(amount) * self.height)
+        else:
+            self.scroll_to(self.offset + int(amount))
+
+    def _on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.offset - 3)
+        else:
+            self.scroll_to(self.offset + 3)
+        return "break"
@@ -0,0 +1,103 @@
+"""Streaming workload traces (CSV or JSON Lines)
+
+Each record has a pid, an arrival time, a burst time and an optional
+priority. An optional "bursts" field (a JSON list, or space separated in
+CSV) gives alternating CPU and I/O bursts; the burst time may then be
+left out. Column/key names "arrival"/"arrival_time" and "burst"/"burst_time"
+are both accepted. Readers are generators, so a trace is never held in
+memory as a whole; pass them to fcfs_stream()/round_robin_stream() for
+traces sorted by arrival time.
+"""
+import csv
+import json
+
+from scheduling_engine import Process, Workload
+
+FIELD_ALIASES = {
+    "pid": ("pid", "id", "process"),
+    "arrival": ("arrival", "arrival_time", "at"),
+    "burst": ("burst", "burst_time", "bt"),
+    "priority": ("priority", "prio"),
+    "bursts": ("bursts", "cpu_io"),
+}
+
+
+def _field(record, name, line_number, default=None):
+    for alias in FIELD_ALIASES[name]:
+        if alias in record and record[alias] not in (None, ""):
+            return record[alias]
+    if default is not None:
+        return default
+    raise ValueError(f"line {line_number}: missing '{name}' field")
+
+
+def _to_process(record, line_number):
+    try:
+        bursts = _field(record, "bursts", line_number, default=())
+        if isinstance(bursts, str):
+            bursts = bursts.split()
+        bursts = [int(b) for b in bursts] or None
+        burst = _field(record, "burst", line_number, default="" if bursts else None)
+        process = Process(str(_field(record, "pid", line_number)),
+                          int(_field(record, "arrival", line_number)),
+                          int(burst) if burst != "" else None,
+                          int(_field(record, "priority", line_number, default=0)),
+                          bursts)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"line {line_number}: {e}") from None
+    if process.burst_time <= 0:
+        raise ValueError(f"line {line_number}: burst time must be positive")
+    return process
+
+
+def iter_csv(path):
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+        for record in reader:
+            yield _to_process(record, reader.line_num)
+
+
+def iter_jsonl(path):
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if line:
+                yield _to_process(json.loads(line), line_number)
+
+
+def iter_trace(path):
+    """Yield Process objects from a .csv or .jsonl/.ndjson trace, one record at a time"""
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        return iter_jsonl(path)
+    return iter_csv(path)
+
+
+def load_workload(path):
+    """Read a whole trace into a columnar Workload (no per-process objects kept)"""
+    workload = Workload()
+    for p in iter_trace(path):
+        workload.append(p.pid, p.arrival_time, p.burst_time, p.priority)
+    return workload
+
+
+def write_trace(processes, path):
+    """Write processes (or a Workload) as a CSV or JSONL trace
+
+    I/O bursts go in a "bursts" field: a list in JSONL, space separated in
+    CSV (empty for processes without I/O).
+    """
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        with open(path, "w") as f:
+            for p in processes:
+                record = {"pid": p.pid, "arrival": p.arrival_time, "burst": p.burst_time, "priority": p.priority}
+                if p.bursts:
+                    record["bursts"] = list(p.bursts)
+                f.write(json.dumps(record) + "\n")
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("pid", "arrival", "burst", "priority", "bursts"))
+            for p in processes:
+                bursts = " ".join(map(str, p.bursts)) if p.bursts else ""
+                writer.writerow((p.pid, p.arrival_time, p.burst_time, p.priority, bursts))